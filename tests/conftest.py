@@ -1,8 +1,37 @@
 import pytest
-import requests
 import json
+import time
 
-from settings import BASE_URL, ENDPOINTS, TIMEOUT
+from dataclasses import asdict
+from urllib.parse import urlsplit
+
+from settings import (
+    BASE_URL, ENDPOINTS, TIMEOUT,
+    DURATIONS_HISTORY, WARMUP_CONNECTIONS,
+)
+from utils import (
+    DnsCache,
+    DurationHistory,
+    DurationRecorder,
+    NetworkMetrics,
+    NetworkReporter,
+    REPORT_ATTRIBUTE,
+    build_client,
+    create_session,
+    order_longest_first,
+    select_within_budget,
+    warm_up,
+    WarmupReport,
+)
+
+duration_history_key = pytest.StashKey()
+http_session_key = pytest.StashKey()
+dns_cache_key = pytest.StashKey()
+warmup_reports_key = pytest.StashKey()
+network_calls_key = pytest.StashKey()
+
+# Key of warm-up report sent from pytest-xdist worker to controller
+WARMUP_OUTPUT = "warmup_report"
 
 
 def _serialization(data: dict):
@@ -24,8 +53,194 @@ def _serialization(data: dict):
         pytest.fail(f"JSON serialization error: {e}")
 
 
+def _account(request, started, response, stream=False):
+    """
+    Record network cost of HTTP call for current test.
+    
+    Calls are recorded only if network report is requested.
+    Streamed response is recorded when it is closed, so body
+    download is included in bytes and time.
+    
+    Args:
+        request: Pytest request of fixture making the call
+        started: perf_counter() value before the call
+        response: Response object, None if call failed
+        stream: True if response body is streamed
+    """
+    metrics = request.config.stash.get(network_calls_key, None)
+    if metrics is None:
+        return
+    if stream and response is not None:
+        metrics.record_stream(request.node.nodeid, started, response)
+    else:
+        metrics.record(
+            request.node.nodeid,
+            time.perf_counter() - started,
+            response,
+        )
+
+
+def pytest_addoption(parser):
+    """Register test scheduling options."""
+    parser.addoption(
+        "--time-budget",
+        type=float,
+        default=None,
+        help="Run most valuable tests fitting into budget (seconds)",
+    )
+    parser.addoption(
+        "--durations-history",
+        default=DURATIONS_HISTORY,
+        help="Path to test duration history file",
+    )
+    parser.addoption(
+        "--warmup-connections",
+        type=int,
+        default=WARMUP_CONNECTIONS,
+        help="Number of pooled connections opened at session start",
+    )
+    parser.addoption(
+        "--network-report",
+        default=None,
+        help="Write per-test HTTP calls, bytes and network time to JSON file",
+    )
+    parser.addoption(
+        "--openmetrics",
+        default=None,
+        help="Write per-test network cost in OpenMetrics text format",
+    )
+
+
+def pytest_configure(config):
+    """
+    Load test duration history, register duration and network recorders,
+    create shared HTTP session and DNS cache of API host.
+    """
+    path = config.rootpath / config.getoption("--durations-history")
+    history = DurationHistory(path)
+    config.stash[duration_history_key] = history
+    config.pluginmanager.register(
+        DurationRecorder(history, save=not hasattr(config, "workerinput")),
+        "duration_recorder",
+    )
+    json_path = config.getoption("--network-report")
+    openmetrics_path = config.getoption("--openmetrics")
+    if json_path or openmetrics_path:
+        config.stash[network_calls_key] = NetworkMetrics()
+        config.pluginmanager.register(
+            NetworkReporter(
+                json_path=json_path,
+                openmetrics_path=openmetrics_path,
+                write=not hasattr(config, "workerinput"),
+            ),
+            "network_reporter",
+        )
+    config.stash[http_session_key] = create_session()
+    config.stash[dns_cache_key] = DnsCache([urlsplit(BASE_URL).hostname])
+    config.stash[warmup_reports_key] = {}
+
+
+def pytest_unconfigure(config):
+    """Close shared HTTP session and restore DNS lookups."""
+    session = config.stash.get(http_session_key, None)
+    if session is not None:
+        session.close()
+        config.stash[dns_cache_key].uninstall()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Attach network cost of finished test to its teardown report."""
+    outcome = yield
+    metrics = item.config.stash.get(network_calls_key, None)
+    if call.when == "teardown" and metrics is not None:
+        counters = metrics.pop(item.nodeid)
+        if counters is not None:
+            setattr(outcome.get_result(), REPORT_ATTRIBUTE, counters)
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    """
+    Order tests longest-first and apply time budget.
+    
+    Steps:
+        1. Sort tests by expected duration from history
+        2. If --time-budget set, keep most valuable tests fitting into it
+    """
+    history = config.stash[duration_history_key]
+    items[:] = order_longest_first(items, history)
+
+    budget = config.getoption("--time-budget")
+    if budget is not None:
+        selected, deselected = select_within_budget(items, history, budget)
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtestloop(session):
+    """
+    Warm up transport before the first test, outside of its setup.
+    
+    Steps:
+        1. Skip collect-only runs and pytest-xdist controller (no items)
+        2. Cache DNS lookups of API host
+        3. Resolve host and open pooled connections concurrently
+        4. Keep report, pytest-xdist worker also sends it to controller
+    """
+    config = session.config
+    if config.option.collectonly or not session.items:
+        return
+    dns_cache = config.stash[dns_cache_key]
+    dns_cache.install()
+    report = warm_up(
+        config.stash[http_session_key],
+        BASE_URL,
+        config.getoption("--warmup-connections"),
+        dns_cache=dns_cache,
+        timeout=TIMEOUT,
+    )
+    if hasattr(config, "workeroutput"):
+        config.workeroutput[WARMUP_OUTPUT] = asdict(report)
+    else:
+        config.stash[warmup_reports_key][""] = report
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Collect warm-up report of finished pytest-xdist worker."""
+    data = getattr(node, "workeroutput", {}).get(WARMUP_OUTPUT)
+    if data is not None:
+        worker = node.workerinput["workerid"]
+        node.config.stash[warmup_reports_key][worker] = WarmupReport(**data)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Report warm-up time of session (of every pytest-xdist worker)."""
+    reports = config.stash.get(warmup_reports_key, {})
+    for worker in sorted(reports):
+        prefix = f"[{worker}] " if worker else ""
+        terminalreporter.write_line(f"{prefix}{reports[worker].summary()}")
+
+
+@pytest.fixture(scope="session")
+def http_session(pytestconfig):
+    """
+    Fixture providing HTTP session shared by all requests.
+    
+    Returns:
+        requests.Session with connection pool
+        
+    Session is created at configure time and warmed up before the
+    first test (pytest_runtestloop), so warm-up time is not added
+    to setup of any test.
+    """
+    return pytestconfig.stash[http_session_key]
+
+
 @pytest.fixture
-def get_request():
+def get_request(http_session, request):
     """
     Fixture for making GET HTTP requests.
     
@@ -35,20 +250,25 @@ def get_request():
     Steps:
         1. Construct full URL from BASE_URL and endpoint
         2. Send GET request with parameters and headers
+           (body is streamed if stream=True)
         3. Handle connection and timeout errors
         4. Return response object
     """
     def _get_request(
             endpoint, 
             params=None,
-            headers=None
+            headers=None,
+            stream=False,
             ):
+        started = time.perf_counter()
+        response = None
         try:
-            response = requests.get(
+            response = http_session.get(
                 url=f"{BASE_URL}{endpoint}",
                 params=params,
                 headers=headers,
                 timeout=TIMEOUT,
+                stream=stream,
             )
             return response
         
@@ -58,12 +278,14 @@ def get_request():
             pytest.fail(f"Timeout: {e}")
         except Exception as e:
             pytest.fail(f"Request failed: {e}")
+        finally:
+            _account(request, started, response, stream=stream)
     
     return _get_request
 
 
 @pytest.fixture
-def post_request():
+def post_request(http_session, request):
     """
     Fixture for making POST HTTP requests.
     
@@ -88,8 +310,10 @@ def post_request():
         
         payload = _serialization(payload)
         
+        started = time.perf_counter()
+        response = None
         try:
-            response = requests.post(
+            response = http_session.post(
                 url=f"{BASE_URL}{endpoint}",
                 data=payload,
                 headers=headers,
@@ -103,12 +327,14 @@ def post_request():
             pytest.fail(f"Timeout: {e}")
         except Exception as e:
             pytest.fail(f"Request failed: {e}")
+        finally:
+            _account(request, started, response)
     
     return _post_request
 
 
 @pytest.fixture
-def put_request():
+def put_request(http_session, request):
     """
     Fixture for making PUT HTTP requests.
     
@@ -133,8 +359,10 @@ def put_request():
         
         payload = _serialization(payload)
 
+        started = time.perf_counter()
+        response = None
         try:
-            response = requests.put(
+            response = http_session.put(
                 url=f"{BASE_URL}{endpoint}",
                 data=payload,
                 headers=headers,
@@ -148,12 +376,14 @@ def put_request():
             pytest.fail(f"Timeout: {e}")
         except Exception as e:
             pytest.fail(f"Request failed: {e}")
+        finally:
+            _account(request, started, response)
     
     return _put_request
 
 
 @pytest.fixture
-def delete_request():
+def delete_request(http_session, request):
     """
     Fixture for making DELETE HTTP requests.
     
@@ -166,8 +396,10 @@ def delete_request():
         3. Return response object
     """
     def _delete_request(payload, endpoint, headers=None):
+        started = time.perf_counter()
+        response = None
         try:
-            response = requests.delete(
+            response = http_session.delete(
                 url=f"{BASE_URL}{endpoint}",
                 json=payload,
                 headers=headers,
@@ -181,5 +413,32 @@ def delete_request():
             pytest.fail(f"Timeout: {e}")
         except Exception as e:
             pytest.fail(f"Request failed: {e}")
+        finally:
+            _account(request, started, response)
     
-    return _delete_request
\ No newline at end of file
+    return _delete_request
+
+
+@pytest.fixture
+def api_client(get_request, post_request, put_request, delete_request):
+    """
+    Fixture providing factory of generated API clients.
+    
+    Returns:
+        Function building client for ENDPOINTS key from RESOURCES description
+        
+    Steps:
+        1. Compile client class for endpoint (once per endpoint)
+        2. Initialize it with shared request fixtures and optional read cache
+    """
+    def _api_client(endpoint, read_cache=None):
+        client_class = build_client(endpoint)
+        return client_class(
+            get_request,
+            post_request,
+            put_request,
+            delete_request,
+            read_cache=read_cache,
+        )
+
+    return _api_client
\ No newline at end of file
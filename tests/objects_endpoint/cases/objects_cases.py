@@ -215,6 +215,17 @@ class TestData:
             ).to_dict()
         ).to_dict()
 
+    @classmethod
+    def sized_data(cls, fields, value_length):
+        """Generate valid object with given number of data fields and value length."""
+        return Object(
+            name=cls.random_product(),
+            data={
+                f"field_{index}": "X" * value_length
+                for index in range(fields)
+            }
+        ).to_dict()
+
 
 def payload(case):
     """
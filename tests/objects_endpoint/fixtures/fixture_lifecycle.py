@@ -0,0 +1,90 @@
+import pytest
+
+from settings import OK
+from utils import Pipeline, Stage
+from objects_endpoint.fixtures.fixture_object import (
+    object_client,
+)
+
+
+def _expect_ok(response, action):
+    """Raise AssertionError if response status is not 200 OK."""
+    if response.status_code != OK:
+        raise AssertionError(
+            f"{action}: expected {OK}, got {response.status_code}, "
+            f"message: {response.text}"
+        )
+
+
+def lifecycle_stages(client, created):
+    """
+    Build CRUD lifecycle stages for objects endpoint.
+    
+    Args:
+        client: ObjectClient used by all stages
+        created: Set of IDs of created and not yet deleted objects,
+            kept up to date by create and delete stages
+        
+    Returns:
+        List of Stage objects: create, check, update, delete
+        
+    Steps:
+        1. create - POST payload, pass (object ID, payload) further
+        2. check - GET object by ID and compare name and data
+        3. update - PUT payload back to created object
+        4. delete - DELETE object by ID
+    """
+    def create(payload_data):
+        response = client.post_object(payload_data)
+        _expect_ok(response, "create")
+        obj_id = response.json()["id"]
+        created.add(obj_id)
+        return obj_id, payload_data
+
+    def check(item):
+        obj_id, payload_data = item
+        response = client.get_by_id(object_id=obj_id)
+        _expect_ok(response, "check")
+        response_data = response.json()
+        if (response_data["name"], response_data["data"]) != (
+            payload_data["name"], payload_data["data"]
+        ):
+            raise AssertionError(f"check: got {response_data}")
+        return item
+
+    def update(item):
+        obj_id, payload_data = item
+        _expect_ok(client.update_object(payload_data, obj_id), "update")
+        return item
+
+    def delete(item):
+        obj_id, _ = item
+        _expect_ok(client.delete_object(obj_id), "delete")
+        created.discard(obj_id)
+        return obj_id
+
+    return [
+        Stage("create", create),
+        Stage("check", check),
+        Stage("update", update),
+        Stage("delete", delete),
+    ]
+
+
+@pytest.fixture
+def lifecycle_pipeline(object_client):
+    """
+    Fixture providing pipelined CRUD lifecycle for objects endpoint.
+    
+    Args:
+        object_client: ObjectClient fixture
+        
+    Returns:
+        Pipeline: Engine running create/check/update/delete stages
+        
+    Objects whose lifecycle failed after creation are deleted on teardown.
+    """
+    created = set()
+    yield Pipeline(lifecycle_stages(object_client, created))
+    for obj_id in list(created):
+        object_client.delete_object(obj_id)
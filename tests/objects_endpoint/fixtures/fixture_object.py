@@ -1,6 +1,6 @@
 import pytest
 
-from settings import ENDPOINTS
+from utils import ReadCache, SpilledCollection, build_client
 from conftest import (
     get_request,
     post_request,
@@ -8,7 +8,7 @@ from conftest import (
     delete_request,
 )
 
-class ObjectClient:
+class ObjectClient(build_client("objects")):
     """
     API client for Objects endpoints.
     
@@ -17,37 +17,27 @@ class ObjectClient:
     - Create new objects
     - Update existing objects  
     - Delete objects
+
+    Built on client generated from RESOURCES["objects"], so request
+    fixtures, read cache and invalidation are shared with generated
+    clients. Adds object_id keyword names and streamed GET all.
+
+    Optional read cache combines identical GETs and serves
+    repeated reads without extra round trips.
     """
-    def __init__(
-            self, 
-            get_request, 
-            post_request,
-            put_request,
-            delete_request,
-        ):
-        """
-        Initialize ObjectClient with request fixtures.
-        
-        Args:
-            get_request: Fixture for GET requests
-            post_request: Fixture for POST requests  
-            put_request: Fixture for PUT requests
-            delete_request: Fixture for DELETE requests
-        """
-        self._get = get_request
-        self._post = post_request
-        self._put = put_request
-        self._delete = delete_request
-        self.base = ENDPOINTS["objects"]
 
-    def get_all(self):
-        """GET all objects.
+    def get_all_spilled(self):
+        """GET all objects streamed to memory-mapped temporary file.
+        
+        Objects are indexed by ID and decoded lazily instead of
+        holding the whole decoded list in memory.
         
         Returns:
-            Response object with list of all objects
+            SpilledCollection with response status code in status_code
         """
-        return self._get(endpoint=self.base)
-    
+        response = self._get(endpoint=self.base, stream=True)
+        return SpilledCollection.from_response(response)
+
     def get_by_id(self, object_id):
         """GET specific object by ID.
         
@@ -57,36 +47,7 @@ class ObjectClient:
         Returns:
             Response object with requested object data
         """
-        return self._get(endpoint=f"{self.base}/{object_id}")
-
-    def get_list_by_ids(self, id_list):
-        """GET multiple objects by list of IDs.
-        
-        Args:
-            id_list: List of object IDs to retrieve
-            
-        Returns:
-            Response object with list of requested objects
-        """
-        ids = {"id": id_list}
-        return self._get(
-            endpoint=self.base, 
-            params=ids
-            )
-    
-    def post_object(self, payload):
-        """POST new object.
-        
-        Args:
-            payload: Dictionary with object data for creation
-            
-        Returns:
-            Response object with created object data
-        """
-        return self._post(
-            endpoint=self.base, 
-            payload=payload,
-            )
+        return super().get_by_id(object_id)
 
     def update_object(self, payload, object_id):
         """PUT update existing object.
@@ -98,10 +59,7 @@ class ObjectClient:
         Returns:
             Response object with updated object data
         """
-        return self._put(
-            endpoint=f"{self.base}/{object_id}",
-            payload=payload
-        )
+        return super().update_object(payload, object_id)
 
     def delete_object(self, object_id):
         """DELETE object by ID.
@@ -112,10 +70,7 @@ class ObjectClient:
         Returns:
             Response object from delete operation
         """
-        return self._delete(
-            endpoint=f"{self.base}/{object_id}",
-            payload=None
-            )
+        return super().delete_object(object_id)
 
 
 @pytest.fixture
@@ -133,3 +88,40 @@ def object_client(get_request, post_request, put_request, delete_request):
         ObjectClient: Configured client for objects API endpoints
     """
     return ObjectClient(get_request, post_request, put_request, delete_request)
+
+
+@pytest.fixture(scope="session")
+def read_cache():
+    """
+    Fixture providing ReadCache shared by the whole test session.
+    
+    Returns:
+        ReadCache: Cache for idempotent GET requests
+    """
+    return ReadCache()
+
+
+@pytest.fixture
+def cached_object_client(
+        get_request,
+        post_request,
+        put_request,
+        delete_request,
+        read_cache,
+    ):
+    """
+    Fixture providing ObjectClient with opt-in read cache.
+    
+    Identical concurrent GETs are combined and repeated reads are
+    served from session cache. PUT/DELETE invalidate object entries.
+    
+    Returns:
+        ObjectClient: Client for objects API endpoints with read cache
+    """
+    return ObjectClient(
+        get_request,
+        post_request,
+        put_request,
+        delete_request,
+        read_cache=read_cache,
+    )
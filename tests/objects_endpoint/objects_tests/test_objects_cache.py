@@ -0,0 +1,227 @@
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+
+from settings import (
+    OK,
+    NOT_FOUND,
+)
+from utils import (
+    ReadCache,
+)
+from utils.read_cache import (
+    NOT_MODIFIED,
+)
+
+from objects_endpoint.fixtures.fixture_object import (
+    cached_object_client,
+    read_cache,
+)
+from objects_endpoint.cases.objects_cases import (
+    payload,
+)
+
+
+@pytest.mark.objects
+class TestObjectCachedGET:
+    """
+    Test suite for cached GET api/Objects requests.
+
+    Tests read cache behaviour:
+    - Repeated reads are served from cache
+    - Concurrent identical reads are combined
+    - PUT/DELETE invalidate cached object
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, cached_object_client, read_cache):
+        """Initialize cached API client and reset cache."""
+        self.client = cached_object_client
+        self.cache = read_cache
+        self.cache.clear()
+
+    def test_repeated_get_by_id(self):
+        """TEST: Repeated GET by ID is served from cache.
+
+        Steps:
+        1. Send GET request for object twice
+        2. Verify both responses are 200 OK
+        3. Verify second response is the cached one
+        """
+        first = self.client.get_by_id(object_id=1)
+        second = self.client.get_by_id(object_id=1)
+
+        assert first.status_code == OK, (
+            f"Expected {OK}, Got {first.status_code}",
+            f"Message: {first.text}"
+        )
+        assert second is first
+        assert self.cache.stats["hits"] == 1
+
+    def test_concurrent_get_all(self):
+        """TEST: Concurrent identical GETs are combined into one request.
+
+        Steps:
+        1. Send GET all objects from several threads at once
+        2. Verify all callers got 200 OK
+        3. Verify only one request reached the backend
+        """
+        workers = 8
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            responses = list(pool.map(
+                lambda _: self.client.get_all(), range(workers)
+            ))
+
+        for response in responses:
+            assert response.status_code == OK, (
+                f"Expected {OK}, Got {response.status_code}",
+                f"Message: {response.text}"
+            )
+        assert self.cache.stats["misses"] == 1, (
+            f"{self.cache.stats}"
+        )
+
+    def test_update_invalidates_cache(self):
+        """TEST: PUT drops cached object and next GET returns fresh data.
+
+        Steps:
+        1. Create object and read it through cache
+        2. Update object with new name
+        3. Read object again
+        4. Verify updated name is returned
+        """
+        payload_data = payload("valid_data")
+        obj_id = self.client.post_object(payload_data).json()["id"]
+        self.client.get_by_id(object_id=obj_id)
+
+        payload_data["name"] = f"{payload_data['name']} updated"
+        self.client.update_object(payload_data, obj_id)
+        response = self.client.get_by_id(object_id=obj_id)
+
+        assert response.status_code == OK, (
+            f"Expected {OK}, Got {response.status_code}",
+            f"Message: {response.text}"
+        )
+        assert response.json()["name"] == payload_data["name"]
+
+        self.client.delete_object(obj_id)
+
+
+class FakeResponse:
+    """Response stub with status code and headers."""
+    def __init__(self, status_code, etag=None):
+        self.status_code = status_code
+        self.headers = {"ETag": etag} if etag else {}
+
+
+class StubFetch:
+    """
+    GET request stub returning prepared responses in order.
+
+    Records headers of every call, runs optional hook before answering.
+    """
+    def __init__(self, *responses, hook=None):
+        self.responses = list(responses)
+        self.calls = []
+        self.hook = hook
+
+    def __call__(self, endpoint, params=None, headers=None):
+        self.calls.append(headers)
+        if self.hook is not None:
+            self.hook()
+        return self.responses.pop(0)
+
+
+class TestReadCacheOffline:
+    """
+    Test suite for read cache with stub GET function.
+    
+    Tests cache rules without network:
+    - TTL expiry and ETag revalidation (304)
+    - LRU eviction at max_size
+    - Non-OK responses are not cached
+    - Invalidation during in-flight request drops its result
+    """
+
+    def test_fresh_entry_is_hit(self):
+        """TEST: Read within TTL is served from cache without fetch."""
+        cache = ReadCache(ttl=60)
+        fetch = StubFetch(FakeResponse(OK))
+
+        first = cache.get(fetch, "/objects/1")
+        second = cache.get(fetch, "/objects/1")
+
+        assert second is first
+        assert len(fetch.calls) == 1
+        assert cache.stats["hits"] == 1
+
+    def test_expired_entry_is_fetched(self):
+        """TEST: Read after TTL expiry sends new request."""
+        cache = ReadCache(ttl=0)
+        fetch = StubFetch(FakeResponse(OK), FakeResponse(OK))
+
+        first = cache.get(fetch, "/objects/1")
+        second = cache.get(fetch, "/objects/1")
+
+        assert second is not first
+        assert fetch.calls == [None, None]
+        assert cache.stats["misses"] == 2
+
+    def test_etag_revalidation(self):
+        """TEST: Expired entry with ETag is revalidated by conditional GET.
+        
+        Verifies:
+        - Second request carries If-None-Match with stored ETag
+        - 304 response returns cached response
+        """
+        cache = ReadCache(ttl=0)
+        fetch = StubFetch(FakeResponse(OK, etag='"v1"'), FakeResponse(NOT_MODIFIED))
+
+        first = cache.get(fetch, "/objects/1")
+        second = cache.get(fetch, "/objects/1")
+
+        assert second is first
+        assert fetch.calls == [None, {"If-None-Match": '"v1"'}]
+        assert cache.stats["revalidated"] == 1
+
+    def test_lru_eviction(self):
+        """TEST: Least recently used entry is evicted at max_size."""
+        cache = ReadCache(ttl=60, max_size=2)
+        fetch = StubFetch(*(FakeResponse(OK) for _ in range(4)))
+
+        cache.get(fetch, "/objects/1")
+        cache.get(fetch, "/objects/2")
+        cache.get(fetch, "/objects/1")
+        cache.get(fetch, "/objects/3")
+        cache.get(fetch, "/objects/1")
+        cache.get(fetch, "/objects/2")
+
+        assert len(fetch.calls) == 4
+        assert cache.stats["hits"] == 2
+
+    def test_error_response_not_cached(self):
+        """TEST: Non-OK response is returned but not stored."""
+        cache = ReadCache(ttl=60)
+        fetch = StubFetch(FakeResponse(NOT_FOUND), FakeResponse(OK))
+
+        first = cache.get(fetch, "/objects/1")
+        second = cache.get(fetch, "/objects/1")
+
+        assert first.status_code == NOT_FOUND
+        assert second.status_code == OK
+        assert len(fetch.calls) == 2
+
+    def test_invalidation_during_request(self):
+        """TEST: Response of request overlapping invalidation is not stored."""
+        cache = ReadCache(ttl=60)
+        fetch = StubFetch(
+            FakeResponse(OK), FakeResponse(OK),
+            hook=lambda: cache.invalidate("/objects/1"),
+        )
+
+        first = cache.get(fetch, "/objects/1")
+        fetch.hook = None
+        second = cache.get(fetch, "/objects/1")
+
+        assert first.status_code == OK
+        assert second is not first
+        assert len(fetch.calls) == 2
@@ -0,0 +1,70 @@
+import pytest
+
+from settings import (
+    OK,
+)
+
+from objects_endpoint.cases.objects_cases import (
+    payload,
+)
+
+
+@pytest.mark.objects
+class TestObjectGeneratedClient:
+    """
+    Test suite for api/Objects client generated from RESOURCES description.
+    
+    Tests that generated client matches hand-written one:
+    - Reads objects and validates response schema
+    - Runs create/update/delete lifecycle
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, api_client):
+        """Initialize generated API client for object endpoints."""
+        self.client = api_client("objects")
+
+    def test_get_by_id(self):
+        """TEST: Get object by ID and validate it against resource schema.
+        
+        Steps:
+        1. Send GET request for object by ID
+        2. Verify response status is 200 OK
+        3. Verify response contains keys from resource schema
+        """
+        response = self.client.get_by_id(1)
+
+        assert response.status_code == OK, (
+            f"Expected {OK}, Got {response.status_code}",
+            f"Message: {response.text}"
+        )
+        lost_keys = self.client.missing_keys(response.json())
+        assert lost_keys == set(), (
+            f"Lost keys of response data: {lost_keys}"
+        )
+
+    def test_object_lifecycle(self):
+        """TEST: Create, update and delete object with generated client.
+        
+        Steps:
+        1. POST valid payload
+        2. PUT payload back to created object
+        3. DELETE created object
+        4. Verify every response is 200 OK
+        """
+        payload_data = payload("valid_data")
+        response = self.client.post_object(payload_data)
+        assert response.status_code == OK, (
+            f"Expected {OK}, Got {response.status_code}",
+            f"Message: {response.text}"
+        )
+        obj_id = response.json()["id"]
+
+        for response in (
+            self.client.update_object(payload_data, obj_id),
+            self.client.delete_object(obj_id),
+        ):
+            assert response.status_code == OK, (
+                f"Expected {OK}, Got {response.status_code}",
+                f"Message: {response.text}"
+            )
@@ -1,9 +1,15 @@
+import json
+import tempfile
+
 import pytest
 
 from settings import (
     OK,
     NOT_FOUND, BAD_REQUEST
 )
+from utils import (
+    SpilledCollection,
+)
 
 from objects_endpoint.fixtures.fixture_object import (
     object_client,
@@ -54,6 +60,31 @@ class TestObjectGET:
             f"{response.json()}"
         )
 
+    def test_get_all_objects_spilled(self):
+        """TEST: Retrieve all objects through memory-mapped spill.
+        
+        Steps:
+        1. Stream all objects to temporary file
+        2. Verify response status is 200 OK
+        3. Verify indexed objects match regular GET all response
+        4. Look up first object by ID
+        
+        Verifies:
+        - Spilled collection indexes every object by ID
+        - Lazy lookup returns the same data as full decoding
+        """
+        expected = self.client.get_all().json()
+
+        with self.client.get_all_spilled() as objects:
+            assert objects.status_code == OK, (
+                f"Expected {OK}, Got {objects.status_code}"
+            )
+            assert len(objects) == len(expected), (
+                f"Expected {len(expected)} objects, Got {len(objects)}"
+            )
+            assert objects.ids() == [str(obj["id"]) for obj in expected]
+            assert objects.get(expected[0]["id"]) == expected[0]
+
     @pytest.mark.parametrize(
         ("object_id_list", "expected_http_code"),
         (
@@ -140,4 +171,80 @@ class TestObjectGET:
 
             assert lost_keys == set(), (
                 f"Lost keys of response data: {lost_keys}"
-            )
\ No newline at end of file
+            )
+
+
+class FakeStreamResponse:
+    """Streamed response stub returning body in small chunks."""
+    def __init__(self, body, status_code=OK):
+        self.body = body
+        self.status_code = status_code
+        self.closed = False
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.body), 7):
+            yield self.body[start:start + 7]
+
+    def close(self):
+        self.closed = True
+
+
+def spill(body, status_code=OK):
+    """Spill raw JSON body to temporary file."""
+    file = tempfile.TemporaryFile()
+    file.write(body)
+    file.flush()
+    return SpilledCollection(file, status_code=status_code)
+
+
+class TestSpilledCollectionOffline:
+    """
+    Test suite for spilled collection index on temporary files.
+    
+    Tests that index:
+    - Skips brackets and escaped quotes inside strings
+    - Uses only top-level "id" key of every object
+    - Ignores error bodies and non-array bodies
+    """
+
+    def test_strings_with_brackets_and_quotes(self):
+        """TEST: Brackets and escaped quotes in strings do not break index."""
+        objects = [
+            {"id": "1", "name": 'a "quoted" [name] {x}', "data": {"note": "\\"}},
+            {"id": "2", "name": "plain", "data": None},
+        ]
+        with spill(json.dumps(objects).encode()) as collection:
+            assert len(collection) == 2
+            assert collection.ids() == ["1", "2"]
+            assert collection.get("1") == objects[0]
+            assert list(collection) == objects
+
+    def test_nested_and_value_ids(self):
+        """TEST: Nested "id" keys and "id" values are not used as object ID."""
+        objects = [
+            {"data": {"id": "nested"}, "name": "id", "tags": ["id"], "id": 7},
+            {"name": "no id"},
+        ]
+        with spill(json.dumps(objects, indent=2).encode()) as collection:
+            assert len(collection) == 2
+            assert collection.ids() == ["7"]
+            assert "nested" not in collection
+            assert collection.get(7) == objects[0]
+
+    @pytest.mark.parametrize(
+        ("body", "status_code"),
+        (
+            (b'{"error": {"id": 5}}', NOT_FOUND),  # Error body
+            (b'{"error": {"id": 5}}', OK),  # Object instead of array
+            (b'[{"id": 5}]', BAD_REQUEST),  # Array with error status
+            (b"", OK),  # Empty body
+        )
+    )
+    def test_non_array_body_is_empty(self, body, status_code):
+        """TEST: Error and non-array bodies give empty collection."""
+        response = FakeStreamResponse(body, status_code=status_code)
+        with SpilledCollection.from_response(response) as collection:
+            assert response.closed
+            assert collection.status_code == status_code
+            assert len(collection) == 0
+            assert collection.get(5) is None
@@ -0,0 +1,156 @@
+import threading
+import time
+
+import pytest
+
+from settings import (
+    PIPELINE_OBJECTS,
+)
+from utils import (
+    Pipeline,
+    Stage,
+)
+
+from objects_endpoint.fixtures.fixture_object import (
+    object_client,
+)
+from objects_endpoint.fixtures.fixture_lifecycle import (
+    lifecycle_pipeline,
+)
+from objects_endpoint.cases.objects_cases import (
+    payload,
+)
+
+
+@pytest.mark.load
+@pytest.mark.objects
+class TestObjectLifecycle:
+    """Load test suite for pipelined CRUD lifecycle of api/Objects."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, lifecycle_pipeline):
+        """Initialize lifecycle pipeline for object endpoints."""
+        self.pipeline = lifecycle_pipeline
+
+    def test_lifecycle_pipeline(self):
+        """TEST: Move many objects through create/check/update/delete.
+        
+        Steps:
+        1. Generate PIPELINE_OBJECTS valid payloads
+        2. Run payloads through pipelined lifecycle stages
+        3. Print per-stage throughput, queue depth and latency
+        4. Verify every object passed all stages
+        
+        Verifies:
+        - API handles concurrent CRUD lifecycle without errors
+        - Limiting stage is reported for end-to-end throughput
+        """
+        payloads = (payload("valid_data") for _ in range(PIPELINE_OBJECTS))
+
+        result = self.pipeline.run(payloads)
+        print(f"\n{result.report()}")
+
+        assert result.errors == [], (
+            f"Failed items: {result.errors[:5]}"
+        )
+        assert len(result.results) == PIPELINE_OBJECTS
+
+
+def run_with_timeout(pipeline, items, timeout=10):
+    """Run pipeline in thread, return None if it did not finish in time."""
+    outcome = []
+    thread = threading.Thread(
+        target=lambda: outcome.append(pipeline.run(items)), daemon=True
+    )
+    thread.start()
+    thread.join(timeout)
+    return outcome[0] if outcome else None
+
+
+class TestPipelineOffline:
+    """
+    Test suite for pipeline engine with stub stage functions.
+    
+    Tests that engine:
+    - Counts stage errors (including BaseException) as failed items
+      and still stops every stage
+    - Blocks producers of slow stage (bounded queues)
+    - Collects per-stage stats
+    """
+
+    def test_stage_errors_fail_items(self):
+        """TEST: Errors and pytest outcomes in stage fail only the item.
+        
+        Steps:
+        1. Run items through stage raising Exception or pytest.skip
+        2. Verify run finishes (no hang on lost stop sentinels)
+        3. Verify failed items are recorded and others pass
+        """
+        def flaky(value):
+            if value % 3 == 1:
+                raise ValueError(value)
+            if value % 3 == 2:
+                pytest.skip("stage skipped")
+            return value
+
+        pipeline = Pipeline([
+            Stage("first", flaky, workers=2, queue_size=2),
+            Stage("second", lambda value: value * 10, workers=2, queue_size=2),
+        ])
+        result = run_with_timeout(pipeline, range(9))
+
+        assert result is not None, "Pipeline did not finish"
+        assert sorted(result.results) == [0, 30, 60]
+        assert len(result.errors) == 6
+        assert {stage for stage, _, _ in result.errors} == {"first"}
+        assert [stats.failed for stats in result.stages] == [6, 0]
+
+    def test_backpressure(self):
+        """TEST: Fast stage is blocked by bounded queue of slow stage.
+        
+        Verifies:
+        - Items waiting for slow stage never exceed its queue size
+          plus item held by blocked producer
+        """
+        lock = threading.Lock()
+        waiting = [0, 0]
+
+        def fast(value):
+            with lock:
+                waiting[0] += 1
+                waiting[1] = max(waiting[1], waiting[0])
+            return value
+
+        def slow(value):
+            with lock:
+                waiting[0] -= 1
+            time.sleep(0.01)
+            return value
+
+        pipeline = Pipeline([
+            Stage("fast", fast, workers=1, queue_size=2),
+            Stage("slow", slow, workers=1, queue_size=2),
+        ])
+        result = run_with_timeout(pipeline, range(20))
+
+        assert result is not None, "Pipeline did not finish"
+        assert len(result.results) == 20
+        assert waiting[1] <= 3, f"{waiting[1]} items waited for slow stage"
+        assert max(result.stages[1].depth_samples) <= 2
+
+    def test_stage_stats(self):
+        """TEST: Per-stage stats count items and point to bottleneck."""
+        pipeline = Pipeline([
+            Stage("quick", lambda value: value, workers=1),
+            Stage("sleepy", lambda value: time.sleep(0.005) or value, workers=1),
+        ])
+        result = run_with_timeout(pipeline, range(10))
+
+        assert result is not None, "Pipeline did not finish"
+        for stats in result.stages:
+            row = stats.to_dict()
+            assert row["processed"] == 10 and row["failed"] == 0, f"{row}"
+            assert len(stats.service_times) == len(stats.wait_times) == 10
+        assert len(result.latencies) == 10
+        assert result.bottleneck == "sleepy"
+        assert "bottleneck: sleepy" in result.report()
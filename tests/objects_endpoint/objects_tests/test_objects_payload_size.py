@@ -0,0 +1,80 @@
+import pytest
+
+from settings import (
+    OK,
+    PAYLOAD_SIZE_FIELDS,
+    PAYLOAD_SIZE_VALUE_LENGTHS,
+    PAYLOAD_SIZE_REPEATS,
+)
+from utils import (
+    measure_payload,
+    size_curve,
+    format_curve,
+)
+
+from objects_endpoint.fixtures.fixture_object import (
+    object_client,
+)
+from objects_endpoint.cases.objects_cases import (
+    TestData,
+)
+
+
+@pytest.mark.load
+@pytest.mark.objects
+class TestObjectPayloadSize:
+    """Benchmark suite for payload size cost of POST and PUT api/Objects."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, object_client):
+        """Initialize API client for object endpoints."""
+        self.client = object_client
+
+    def test_payload_size_scaling(self):
+        """TEST: Measure POST/PUT cost for growing payload sizes.
+        
+        Steps:
+        1. For each number of fields and value length generate payload
+        2. POST payload and PUT it back to created object
+        3. Measure status, bytes on the wire, client time, server latency, decoding
+        4. Delete created object (even if PUT failed)
+        5. Print throughput-versus-size curve
+        
+        Rejected sizes (413, timeout) are recorded in the curve instead of
+        stopping the sweep, so the curve shows payload limits.
+        
+        Verifies:
+        - API accepts payload of the smallest measured size
+        """
+        samples = []
+        for fields in PAYLOAD_SIZE_FIELDS:
+            for value_length in PAYLOAD_SIZE_VALUE_LENGTHS:
+                for _ in range(PAYLOAD_SIZE_REPEATS):
+                    payload_data = TestData.sized_data(fields, value_length)
+
+                    post, response = measure_payload(
+                        "POST", self.client.post_object,
+                        payload_data, fields, value_length,
+                    )
+                    samples.append(post)
+                    if post.status_code != OK:
+                        continue
+
+                    obj_id = response.json()["id"]
+                    try:
+                        put, _ = measure_payload(
+                            "PUT",
+                            lambda data: self.client.update_object(data, obj_id),
+                            payload_data, fields, value_length,
+                        )
+                        samples.append(put)
+                    finally:
+                        self.client.delete_object(obj_id)
+
+        print(f"\n{format_curve(size_curve(samples))}")
+
+        smallest = samples[0]
+        assert smallest.status_code == OK, (
+            f"Expected {OK}, Got {smallest.status_code}",
+            f"Payload: {smallest.fields} fields x {smallest.value_length} chars"
+        )
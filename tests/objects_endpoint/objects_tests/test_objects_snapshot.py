@@ -0,0 +1,163 @@
+import pytest
+
+from settings import (
+    OK,
+)
+from utils import (
+    Snapshot,
+    fetch_changes,
+)
+
+from objects_endpoint.fixtures.fixture_object import (
+    object_client,
+)
+from objects_endpoint.cases.objects_cases import (
+    payload,
+)
+
+
+@pytest.mark.objects
+class TestObjectSnapshot:
+    """
+    Test suite for change detection of api/Objects by content hashing.
+    
+    Tests snapshot scenarios including:
+    - Unchanged objects give equal snapshot roots
+    - Updated object is reported as changed and re-fetched
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, object_client):
+        """Initialize API client for object endpoints."""
+        self.client = object_client
+
+    def snapshot(self, id_list):
+        """Take snapshot of objects with given IDs."""
+        response = self.client.get_list_by_ids(id_list=id_list)
+        assert response.status_code == OK, (
+            f"Expected {OK}, Got {response.status_code}",
+            f"Message: {response.text}"
+        )
+        return Snapshot.from_objects(response.json())
+
+    def test_snapshot_unchanged(self):
+        """TEST: Repeated snapshot of unchanged objects has equal root.
+        
+        Steps:
+        1. Take snapshot of objects by ID list twice
+        2. Verify roots are equal and diff is empty
+        """
+        before = self.snapshot([1, 2, 3])
+        after = self.snapshot([1, 2, 3])
+
+        assert before.root == after.root
+        assert not before.diff(after), (
+            f"{before.diff(after)}"
+        )
+
+    def test_snapshot_detects_update(self):
+        """TEST: Snapshot diff reports updated object and re-fetches it.
+        
+        Steps:
+        1. Create object and take snapshot with it
+        2. Update object name and take snapshot again
+        3. Verify diff contains only updated object as changed
+        4. Re-fetch changed objects by ID list
+        5. Verify re-fetched object has new name
+        """
+        payload_data = payload("valid_data")
+        obj_id = self.client.post_object(payload_data).json()["id"]
+        id_list = [1, 2, obj_id]
+        before = self.snapshot(id_list)
+
+        payload_data["name"] = f"{payload_data['name']} updated"
+        self.client.update_object(payload_data, obj_id)
+        after = self.snapshot(id_list)
+        diff = before.diff(after)
+
+        assert diff.changed == {str(obj_id)}, f"{diff}"
+        assert diff.added == diff.removed == set(), f"{diff}"
+
+        response = fetch_changes(self.client, diff)
+        assert response.status_code == OK, (
+            f"Expected {OK}, Got {response.status_code}",
+            f"Message: {response.text}"
+        )
+        assert response.json()[0]["name"] == payload_data["name"]
+
+        self.client.delete_object(obj_id)
+
+
+def synthetic_hashes(count):
+    """Build object ID to hash map of synthetic collection."""
+    return {str(object_id): f"hash-{object_id}" for object_id in range(count)}
+
+
+class TestSnapshotOffline:
+    """
+    Test suite for snapshot diff on synthetic hash maps.
+    
+    Tests that snapshots:
+    - Report added, removed and changed IDs across buckets
+    - Handle empty collections and reject depth mismatch
+    - Survive save/load between runs
+    """
+
+    def test_diff_across_buckets(self):
+        """TEST: Diff reports every added, removed and changed ID."""
+        old_hashes = synthetic_hashes(1000)
+        new_hashes = dict(old_hashes)
+        removed = {"1", "500", "999"}
+        changed = {"2", "3", "777"}
+        added = {"new-1", "new-2"}
+        for object_id in removed:
+            del new_hashes[object_id]
+        for object_id in changed:
+            new_hashes[object_id] = "updated"
+        for object_id in added:
+            new_hashes[object_id] = "created"
+
+        diff = Snapshot(old_hashes).diff(Snapshot(new_hashes))
+
+        assert diff.added == added, f"{diff}"
+        assert diff.removed == removed, f"{diff}"
+        assert diff.changed == changed, f"{diff}"
+
+    def test_equal_collections(self):
+        """TEST: Equal hash maps give equal roots and empty diff."""
+        before = Snapshot(synthetic_hashes(100))
+        after = Snapshot(synthetic_hashes(100))
+
+        assert before.root == after.root
+        assert not before.diff(after)
+        assert len(before) == 100
+
+    def test_empty_collection(self):
+        """TEST: Empty snapshot has no root and diffs as all added/removed."""
+        empty = Snapshot({})
+        full = Snapshot(synthetic_hashes(10))
+
+        assert empty.root is None
+        assert len(empty) == 0
+        assert not empty.diff(Snapshot({}))
+        assert empty.diff(full).added == set(synthetic_hashes(10))
+        assert full.diff(empty).removed == set(synthetic_hashes(10))
+
+    def test_depth_mismatch(self):
+        """TEST: Snapshots with different depth cannot be compared."""
+        with pytest.raises(ValueError):
+            Snapshot({}, depth=2).diff(Snapshot({}, depth=3))
+
+    def test_save_and_load(self, tmp_path):
+        """TEST: Saved snapshot is loaded with the same root and hashes."""
+        path = tmp_path / "snapshot.json"
+        saved = Snapshot(synthetic_hashes(50), depth=2)
+        saved.save(path)
+
+        loaded = Snapshot.load(path)
+        changed = dict(synthetic_hashes(50), **{"7": "updated"})
+
+        assert loaded.depth == 2
+        assert loaded.root == saved.root
+        assert loaded.hashes == saved.hashes
+        assert loaded.diff(Snapshot(changed, depth=2)).changed == {"7"}
@@ -0,0 +1,210 @@
+import math
+import random
+import time
+
+import pytest
+
+from settings import (
+    OK,
+    STRESS_OBJECTS,
+    STRESS_WORKERS,
+    STRESS_OPERATIONS,
+    STRESS_DELETE_RATIO,
+)
+from utils import (
+    Operation,
+    check_linearizability,
+    check_read_your_writes,
+    stress_objects,
+)
+from utils.consistency import (
+    READ,
+    WRITE,
+    DELETED,
+)
+
+from objects_endpoint.fixtures.fixture_object import (
+    object_client,
+)
+from objects_endpoint.cases.objects_cases import (
+    payload,
+)
+
+
+@pytest.mark.load
+@pytest.mark.objects
+class TestObjectConcurrentWrites:
+    """Stress test suite for consistency of api/Objects under concurrent writes."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, object_client):
+        """Create shared objects and delete them after test."""
+        self.client = object_client
+        self.objects = {}
+        for _ in range(STRESS_OBJECTS):
+            payload_data = payload("valid_data")
+            response = self.client.post_object(payload_data)
+            assert response.status_code == OK, (
+                f"Expected {OK}, Got {response.status_code}",
+                f"Message: {response.text}"
+            )
+            self.objects[response.json()["id"]] = payload_data["name"]
+        yield
+        for obj_id in self.objects:
+            self.client.delete_object(obj_id)
+
+    def test_concurrent_writes_consistency(self):
+        """TEST: Interleaved PUT/GET/DELETE on shared objects stay consistent.
+        
+        Steps:
+        1. Run workers issuing random PUT/GET/DELETE on shared objects
+        2. Record timestamped history of every operation
+        3. Check history for read-your-writes violations
+        4. Check history for register linearizability violations
+        
+        Verifies:
+        - Worker always reads its own completed writes
+        - Every object behaves as linearizable register
+        """
+        history = stress_objects(
+            self.client,
+            self.objects,
+            workers=STRESS_WORKERS,
+            operations=STRESS_OPERATIONS,
+            delete_ratio=STRESS_DELETE_RATIO,
+        )
+        operations = history.operations
+        print(f"\nRecorded {len(operations)} operations")
+
+        violations = check_read_your_writes(operations)
+        assert violations == [], (
+            f"Read-your-writes violations: {violations[:5]}"
+        )
+        violations = check_linearizability(operations)
+        assert violations == [], (
+            f"Linearizability violations: {violations[:5]}"
+        )
+
+
+def write(worker, value, start, end, key="1"):
+    """Build write operation of synthetic history."""
+    return Operation(worker, WRITE, key, value, start, end)
+
+
+def read(worker, value, start, end, key="1"):
+    """Build read operation of synthetic history."""
+    return Operation(worker, READ, key, value, start, end)
+
+
+class TestConsistencyCheckers:
+    """
+    Test suite for history checkers on synthetic histories.
+    
+    Tests that checkers:
+    - Detect stale reads, read inversions and read-your-writes misses
+    - Accept valid histories with unknown-outcome writes and deletes
+    - Handle histories with hundreds of thousands of operations
+    """
+
+    def test_stale_read_after_completed_write(self):
+        """TEST: Read of old value after completed write is not linearizable."""
+        history = [
+            write("setup", "a", 0, 0),
+            write(1, "b", 1, 2),
+            read(2, "a", 3, 4),
+        ]
+
+        assert check_linearizability(history) != []
+
+    def test_read_inversion(self):
+        """TEST: Reading new value, then old one is not linearizable."""
+        history = [
+            write("setup", "a", 0, 0),
+            write(1, "b", 1, 10),
+            read(2, "b", 2, 3),
+            read(2, "a", 4, 5),
+        ]
+
+        assert check_linearizability(history) != []
+
+    def test_read_your_writes_miss(self):
+        """TEST: Worker reading older value after own write is reported."""
+        history = [
+            write("setup", "a", 0, 0),
+            write(1, "b", 1, 2),
+            read(1, "a", 3, 4),
+        ]
+
+        violations = check_read_your_writes(history)
+        assert len(violations) == 1, f"{violations}"
+        assert violations[0].check == "read-your-writes"
+
+    def test_unknown_outcome_write(self):
+        """TEST: Write with unknown outcome may take effect later.
+        
+        Verifies:
+        - Reading old, then unknown-outcome value is valid
+        - Reading unknown-outcome value, then old one is not
+        """
+        valid = [
+            write("setup", "a", 0, 0),
+            write(1, "b", 1, math.inf),
+            read(2, "a", 2, 3),
+            read(2, "b", 4, 5),
+        ]
+        invalid = valid[:2] + [read(2, "b", 2, 3), read(2, "a", 4, 5)]
+
+        assert check_linearizability(valid) == []
+        assert check_read_your_writes(valid) == []
+        assert check_linearizability(invalid) != []
+
+    def test_repeated_delete(self):
+        """TEST: Failed delete followed by successful delete is valid.
+        
+        Verifies:
+        - Deletes of object are not reported as duplicate writes
+        - Write completed after deletion is reported
+        """
+        history = [
+            write("setup", "a", 0, 0),
+            write(1, f"{DELETED}1-1-0", 1, math.inf),
+            write(2, f"{DELETED}1-2-0", 2, 3),
+            read(3, f"{DELETED}1", 4, 5),
+            read(1, f"{DELETED}1", 6, 7),
+        ]
+
+        assert check_linearizability(history) == []
+        assert check_read_your_writes(history) == []
+        assert check_linearizability(history + [write(3, "b", 8, 9)]) != []
+
+    def test_large_history(self):
+        """TEST: Checkers handle 200k operations of linearizable history.
+        
+        Steps:
+        1. Simulate register with overlapping operations on 10 objects
+        2. Run both checkers and measure time
+        3. Verify no violations and time within bound
+        """
+        rng = random.Random(0)
+        values = {key: f"init-{key}" for key in range(10)}
+        history = [
+            write("setup", value, 0, 0, key=str(key))
+            for key, value in values.items()
+        ]
+        for index in range(200_000):
+            key = rng.randrange(10)
+            start = index + rng.random() * 0.5
+            end = index + 1 + rng.random() * 0.5
+            # Effect takes place at index + 0.75, within every operation
+            if rng.random() < 0.5:
+                values[key] = f"v{index}"
+                history.append(write(index % 16, values[key], start, end, key=str(key)))
+            else:
+                history.append(read(index % 16, values[key], start, end, key=str(key)))
+
+        started = time.perf_counter()
+        assert check_read_your_writes(history) == []
+        assert check_linearizability(history) == []
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 10, f"Checkers took {elapsed:.1f}s"
@@ -1,3 +1,4 @@
 from settings.endpoints import *
 from settings.http_codes import *
+from settings.performance import *
 
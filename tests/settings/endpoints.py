@@ -3,4 +3,19 @@ BASE_URL = "https://api.restful-api.dev/"
 
 ENDPOINTS = {
     "objects": "objects",
-}
\ No newline at end of file
+}
+
+# Resource descriptions for generated clients (utils.build_client)
+# resource: name used in method names (post_<resource>, ...)
+# verbs: supported HTTP methods
+# id_style: "path" (endpoint/<id>) or "query" (endpoint?<id_param>=<id>)
+# schema: keys required in response item
+RESOURCES = {
+    "objects": {
+        "resource": "object",
+        "verbs": ("GET", "POST", "PUT", "DELETE"),
+        "id_style": "path",
+        "id_param": "id",
+        "schema": ("id", "name", "data"),
+    },
+}
@@ -0,0 +1,35 @@
+# Read cache for idempotent GET requests
+CACHE_TTL = 5
+CACHE_MAX_SIZE = 256
+
+# Pipelined CRUD lifecycle
+PIPELINE_OBJECTS = 20
+PIPELINE_WORKERS = 4
+PIPELINE_QUEUE_SIZE = 16
+
+# Payload-size scaling benchmark
+PAYLOAD_SIZE_FIELDS = [1, 10, 100, 1000]
+PAYLOAD_SIZE_VALUE_LENGTHS = [10, 100, 1000]
+PAYLOAD_SIZE_REPEATS = 3
+
+# Spill of large get_all responses to disk
+SPILL_CHUNK_SIZE = 64 * 1024
+
+# Content-hash snapshots of objects collection
+SNAPSHOT_TREE_DEPTH = 3
+
+# Concurrent-write stress mode
+STRESS_OBJECTS = 4
+STRESS_WORKERS = 8
+STRESS_OPERATIONS = 50
+STRESS_DELETE_RATIO = 0.02
+
+# Duration-aware test scheduling
+DURATIONS_HISTORY = ".test_durations.json"
+DURATION_SMOOTHING = 0.3
+DEFAULT_TEST_DURATION = 1.0
+
+# Pooled transport and session start warm-up
+HTTP_POOL_SIZE = 16
+WARMUP_CONNECTIONS = 4
+DNS_CACHE_TTL = 300
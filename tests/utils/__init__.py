@@ -0,0 +1,22 @@
+from utils.read_cache import ReadCache
+from utils.pipeline import Pipeline, PipelineResult, Stage, StageStats
+from utils.payload_size import PayloadSample, measure_payload, size_curve, format_curve
+from utils.spill import SpilledCollection
+from utils.snapshot import Snapshot, SnapshotDiff, object_hash, fetch_changes
+from utils.consistency import (
+    History,
+    Operation,
+    Violation,
+    check_linearizability,
+    check_read_your_writes,
+    stress_objects,
+)
+from utils.scheduling import (
+    DurationHistory,
+    DurationRecorder,
+    order_longest_first,
+    select_within_budget,
+)
+from utils.transport import DnsCache, WarmupReport, create_session, warm_up
+from utils.metrics import NetworkMetrics, NetworkReporter, REPORT_ATTRIBUTE
+from utils.client import ResourceClient, build_client
@@ -0,0 +1,187 @@
+from urllib.parse import urlencode
+
+from settings import ENDPOINTS, RESOURCES
+
+VERBS = ("GET", "POST", "PUT", "DELETE")
+ID_STYLES = ("path", "query")
+
+_compiled = {}
+
+
+class ResourceClient:
+    """
+    Base of API clients compiled from resource descriptions.
+
+    Uses the same request fixtures as hand-written clients, so every
+    generated client shares pooled transport, JSON serialization,
+    network metrics and optional read cache.
+    """
+    endpoint = None
+    resource = None
+    id_style = "path"
+    id_param = "id"
+    schema = frozenset()
+
+    def __init__(
+            self,
+            get_request,
+            post_request,
+            put_request,
+            delete_request,
+            read_cache=None,
+        ):
+        """
+        Initialize client with request fixtures.
+
+        Args:
+            get_request: Fixture for GET requests
+            post_request: Fixture for POST requests
+            put_request: Fixture for PUT requests
+            delete_request: Fixture for DELETE requests
+            read_cache: Optional ReadCache for GET requests
+        """
+        self._get = get_request
+        self._post = post_request
+        self._put = put_request
+        self._delete = delete_request
+        self._read_cache = read_cache
+        self.base = ENDPOINTS[self.endpoint]
+
+    def _item(self, item_id):
+        """Endpoint of single item for configured ID style."""
+        if self.id_style == "query":
+            return f"{self.base}?{urlencode({self.id_param: item_id})}"
+        return f"{self.base}/{item_id}"
+
+    def _read(self, endpoint, params=None):
+        """Send GET request through read cache if enabled."""
+        if self._read_cache is None:
+            return self._get(endpoint=endpoint, params=params)
+        return self._read_cache.get(self._get, endpoint, params)
+
+    def _invalidate(self, item_id):
+        """Drop cached reads of item and of collection."""
+        if self._read_cache is not None:
+            self._read_cache.invalidate(self._item(item_id), self.base)
+
+    def missing_keys(self, data):
+        """
+        Check response data against resource schema.
+
+        Args:
+            data: Decoded response item
+
+        Returns:
+            Set of required keys missing in data
+        """
+        return set(self.schema) - set(data)
+
+
+def _get_methods():
+    def get_all(self):
+        """GET all items."""
+        return self._read(endpoint=self.base)
+
+    def get_by_id(self, item_id):
+        """GET specific item by ID."""
+        return self._read(endpoint=self._item(item_id))
+
+    def get_list_by_ids(self, id_list):
+        """GET multiple items by list of IDs."""
+        return self._read(endpoint=self.base, params={self.id_param: id_list})
+
+    return {
+        "get_all": get_all,
+        "get_by_id": get_by_id,
+        "get_list_by_ids": get_list_by_ids,
+    }
+
+
+def _post_methods(resource):
+    def post(self, payload):
+        """POST new item."""
+        response = self._post(endpoint=self.base, payload=payload)
+        if self._read_cache is not None:
+            self._read_cache.invalidate(self.base)
+        return response
+
+    return {f"post_{resource}": post}
+
+
+def _put_methods(resource):
+    def update(self, payload, item_id):
+        """PUT update existing item."""
+        response = self._put(endpoint=self._item(item_id), payload=payload)
+        self._invalidate(item_id)
+        return response
+
+    return {f"update_{resource}": update}
+
+
+def _delete_methods(resource):
+    def delete(self, item_id):
+        """DELETE item by ID."""
+        response = self._delete(endpoint=self._item(item_id), payload=None)
+        self._invalidate(item_id)
+        return response
+
+    return {f"delete_{resource}": delete}
+
+
+def build_client(endpoint):
+    """
+    Compile client class for endpoint from RESOURCES description.
+
+    Class is built once per endpoint and reused. Methods are
+    generated only for supported verbs:
+    - GET: get_all, get_by_id, get_list_by_ids
+    - POST: post_<resource>
+    - PUT: update_<resource>
+    - DELETE: delete_<resource>
+
+    Args:
+        endpoint: Key in ENDPOINTS and RESOURCES
+
+    Returns:
+        ResourceClient subclass
+
+    Raises:
+        ValueError: If endpoint is not described or description is invalid
+    """
+    if endpoint in _compiled:
+        return _compiled[endpoint]
+
+    if endpoint not in ENDPOINTS or endpoint not in RESOURCES:
+        raise ValueError(f"Unknown endpoint: {endpoint}")
+    description = RESOURCES[endpoint]
+    resource = description["resource"]
+    verbs = tuple(verb.upper() for verb in description.get("verbs", VERBS))
+    id_style = description.get("id_style", "path")
+
+    unknown = set(verbs) - set(VERBS)
+    if unknown:
+        raise ValueError(f"Unsupported verbs for {endpoint}: {unknown}")
+    if id_style not in ID_STYLES:
+        raise ValueError(f"Unsupported ID style for {endpoint}: {id_style}")
+
+    attributes = {
+        "__doc__": f"API client for {endpoint} endpoint (generated).",
+        "endpoint": endpoint,
+        "resource": resource,
+        "id_style": id_style,
+        "id_param": description.get("id_param", "id"),
+        "schema": frozenset(description.get("schema", ())),
+    }
+    if "GET" in verbs:
+        attributes.update(_get_methods())
+    if "POST" in verbs:
+        attributes.update(_post_methods(resource))
+    if "PUT" in verbs:
+        attributes.update(_put_methods(resource))
+    if "DELETE" in verbs:
+        attributes.update(_delete_methods(resource))
+
+    class_name = "Generated" + "".join(part.title() for part in resource.split("_")) + "Client"
+    client_class = type(class_name, (ResourceClient,), attributes)
+    _compiled[endpoint] = client_class
+    return client_class
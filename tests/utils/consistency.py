@@ -0,0 +1,320 @@
+import math
+import random
+import threading
+import time
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Any, List
+
+import pytest
+
+from settings import OK, NOT_FOUND
+
+WRITE = "write"
+READ = "read"
+DELETED = "<deleted>"
+
+
+@dataclass
+class Operation:
+    """
+    One completed operation of concurrent history.
+
+    Contains worker, object ID, written or observed value and
+    invocation/response timestamps. Writes with unknown outcome
+    (request error) have end = inf: they may take effect any time later.
+    """
+    worker: Any
+    kind: str
+    key: str
+    value: Any
+    start: float
+    end: float
+
+
+@dataclass
+class Violation:
+    """Consistency violation found by checker."""
+    check: str
+    key: str
+    detail: str
+
+
+class History:
+    """
+    Thread-safe recorder of timestamped operations.
+
+    Each worker appends to its own list, lists are merged on read.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._lists = {}
+
+    def record(self, operation):
+        """Append operation to history of its worker."""
+        ops = self._lists.get(operation.worker)
+        if ops is None:
+            with self._lock:
+                ops = self._lists.setdefault(operation.worker, [])
+        ops.append(operation)
+
+    @property
+    def operations(self) -> List[Operation]:
+        """All recorded operations ordered by invocation time."""
+        merged = [op for ops in self._lists.values() for op in ops]
+        return sorted(merged, key=lambda op: op.start)
+
+    def __len__(self):
+        return sum(len(ops) for ops in self._lists.values())
+
+
+def _deleted_value(key):
+    """Value observed by read of deleted object (404)."""
+    return f"{DELETED}{key}"
+
+
+def _is_delete(op):
+    """True if operation is DELETE (write of deleted value)."""
+    return op.kind == WRITE and str(op.value).startswith(DELETED)
+
+
+def _merge_deletes(operations):
+    """
+    Replace DELETE writes of every object with one terminal write.
+
+    Each DELETE writes unique value, but 404 read cannot tell which
+    delete it observed. Deletion is terminal, so all deletes of object
+    are merged into one write of _deleted_value(key) spanning from the
+    earliest invocation to the earliest known completion.
+
+    Args:
+        operations: Iterable of Operation
+
+    Returns:
+        List of operations with merged deletes (same order otherwise)
+    """
+    merged, deletes = [], {}
+    for op in operations:
+        if _is_delete(op):
+            deletes.setdefault(op.key, []).append(op)
+        else:
+            merged.append(op)
+    for key, ops in deletes.items():
+        merged.append(Operation(
+            ops[0].worker,
+            WRITE,
+            key,
+            _deleted_value(key),
+            min(op.start for op in ops),
+            min(op.end for op in ops),
+        ))
+    return merged
+
+
+def check_read_your_writes(operations) -> List[Violation]:
+    """
+    Verify every worker observes its own completed writes.
+
+    Read by a worker after its write to the same object must return
+    that value or a value written no earlier than it (not older one).
+
+    Args:
+        operations: List of Operation ordered by invocation time
+
+    Returns:
+        List of Violation (empty if history satisfies read-your-writes)
+    """
+    writes = {
+        (op.key, op.value): op
+        for op in _merge_deletes(operations) if op.kind == WRITE
+    }
+    last_own = {}
+    violations = []
+    for op in operations:
+        if op.kind == WRITE:
+            if op.end != math.inf:
+                last_own[(op.worker, op.key)] = op
+            continue
+
+        own = last_own.get((op.worker, op.key))
+        if own is None or op.start < own.end:
+            continue
+        observed = writes.get((op.key, op.value))
+        if observed is None or observed.end < own.start:
+            violations.append(Violation(
+                "read-your-writes", op.key,
+                f"worker {op.worker} wrote {own.value!r}, then read {op.value!r}",
+            ))
+    return violations
+
+
+def check_linearizability(operations) -> List[Violation]:
+    """
+    Verify each object behaves as linearizable register.
+
+    Every written value is unique, so the check is polynomial
+    (Gibbons-Korach zones, O(n log n)) instead of search over orders:
+    - Write and reads of one value form a cluster
+    - Cluster with min response before max invocation has forward
+      zone it must occupy alone; otherwise backward zone it may
+      shrink to a point in
+    - History is linearizable iff forward zones do not overlap and
+      no backward zone lies inside another cluster's forward zone
+    - Deletion is terminal: deletes of object are merged into one
+      write, and no write may start after deletion completed
+
+    Args:
+        operations: Iterable of Operation
+
+    Returns:
+        List of Violation (empty if history is linearizable)
+    """
+    by_key = {}
+    for op in _merge_deletes(operations):
+        by_key.setdefault(op.key, []).append(op)
+
+    violations = []
+    for key, ops in by_key.items():
+        clusters = {}
+        for op in ops:
+            if op.kind == WRITE:
+                cluster = clusters.setdefault(op.value, {"write": None, "reads": []})
+                if cluster["write"] is not None:
+                    violations.append(Violation(
+                        "linearizability", key, f"value {op.value!r} written twice",
+                    ))
+                cluster["write"] = op
+
+        deleted = clusters.get(_deleted_value(key))
+        if deleted is not None:
+            for op in ops:
+                if op.kind == WRITE and op is not deleted["write"] \
+                        and op.end != math.inf and op.start > deleted["write"].end:
+                    violations.append(Violation(
+                        "linearizability", key, f"value {op.value!r} written after deletion",
+                    ))
+
+        for op in ops:
+            if op.kind != READ:
+                continue
+            cluster = clusters.get(op.value)
+            if cluster is None:
+                violations.append(Violation(
+                    "linearizability", key, f"read {op.value!r} that was never written",
+                ))
+            elif op.end < cluster["write"].start:
+                violations.append(Violation(
+                    "linearizability", key, f"read {op.value!r} before it was written",
+                ))
+            else:
+                cluster["reads"].append(op)
+
+        forward, backward = [], []
+        for value, cluster in clusters.items():
+            members = [cluster["write"]] + cluster["reads"]
+            min_end = min(op.end for op in members)
+            max_start = max(op.start for op in members)
+            if min_end < max_start:
+                forward.append((min_end, max_start, value))
+            else:
+                backward.append((max_start, min_end, value))
+
+        forward.sort()
+        for previous, current in zip(forward, forward[1:]):
+            if current[0] < previous[1]:
+                violations.append(Violation(
+                    "linearizability", key,
+                    f"values {previous[2]!r} and {current[2]!r} overlap",
+                ))
+
+        starts = [zone[0] for zone in forward]
+        for low, high, value in backward:
+            index = bisect_right(starts, low) - 1
+            if index >= 0 and forward[index][1] > high and forward[index][0] < low:
+                violations.append(Violation(
+                    "linearizability", key,
+                    f"value {value!r} observed inside {forward[index][2]!r}",
+                ))
+    return violations
+
+
+def stress_objects(
+        client,
+        object_ids,
+        workers,
+        operations,
+        delete_ratio=0.0,
+        seed=None,
+    ):
+    """
+    Run interleaved PUT/GET/DELETE on shared objects and record history.
+
+    Every PUT writes unique name, GET observes current name
+    (deleted value for 404), DELETE is recorded as write of unique
+    deleted value.
+
+    Args:
+        client: ObjectClient used by all workers
+        object_ids: Dictionary of object ID to its current name
+        workers: Number of concurrent workers
+        operations: Number of operations per worker
+        delete_ratio: Share of DELETE operations
+        seed: Seed for random choice of operations
+
+    Returns:
+        History with timestamped operations (initial names included)
+    """
+    history = History()
+    start = time.perf_counter()
+    for object_id, name in object_ids.items():
+        history.record(Operation("setup", WRITE, str(object_id), name, start, start))
+    ids = list(object_ids)
+
+    def worker(number):
+        rng = random.Random(None if seed is None else seed + number)
+        for index in range(operations):
+            object_id = rng.choice(ids)
+            key = str(object_id)
+            roll = rng.random()
+            if roll < delete_ratio:
+                kind, value = WRITE, f"{_deleted_value(key)}-{number}-{index}"
+            elif roll < (1 + delete_ratio) / 2:
+                kind, value = WRITE, f"w{number}-{index}"
+            else:
+                kind, value = READ, None
+
+            start = time.perf_counter()
+            try:
+                if roll < delete_ratio:
+                    response = client.delete_object(object_id)
+                elif kind == WRITE:
+                    response = client.update_object({"name": value}, object_id)
+                else:
+                    response = client.get_by_id(object_id=object_id)
+                    if response.status_code == OK:
+                        value = response.json()["name"]
+                    elif response.status_code == NOT_FOUND:
+                        value = _deleted_value(key)
+            except (Exception, pytest.fail.Exception):
+                if kind == WRITE:
+                    history.record(Operation(number, kind, key, value, start, math.inf))
+                continue
+            end = time.perf_counter()
+
+            if response.status_code == OK or (
+                kind == READ and response.status_code == NOT_FOUND
+            ):
+                history.record(Operation(number, kind, key, value, start, end))
+            elif kind == WRITE and response.status_code != NOT_FOUND:
+                # Outcome is unknown, write may still take effect
+                history.record(Operation(number, kind, key, value, start, math.inf))
+
+    threads = [
+        threading.Thread(target=worker, args=(number,), daemon=True)
+        for number in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return history
@@ -0,0 +1,229 @@
+import json
+import threading
+import time
+
+METRIC_PREFIX = "api_test"
+# Test report attribute carrying counters (forwarded by pytest-xdist)
+REPORT_ATTRIBUTE = "network_cost"
+
+# name, help text, NetworkMetrics field
+_COUNTERS = (
+    ("http_calls", "HTTP calls made by test.", "calls"),
+    ("http_failed_calls", "HTTP calls of test that raised error.", "failed_calls"),
+    ("bytes_sent", "Bytes sent by test (request line, headers, body).", "bytes_sent"),
+    ("bytes_received", "Bytes received by test (status line, headers, body).", "bytes_received"),
+    ("network_seconds", "Seconds test spent waiting on network.", "network_time"),
+)
+
+
+def _headers_size(headers):
+    """Approximate size of HTTP headers block in bytes."""
+    return sum(len(f"{name}: {value}\r\n") for name, value in headers.items()) + 2
+
+
+def request_size(request):
+    """Approximate bytes of prepared request on the wire."""
+    body = request.body or b""
+    if isinstance(body, str):
+        body = body.encode()
+    return len(f"{request.method} {request.path_url} HTTP/1.1\r\n") + \
+        _headers_size(request.headers) + len(body)
+
+
+def response_size(response, body_size=None):
+    """
+    Approximate bytes of response on the wire.
+
+    Body is counted as bytes pulled from the socket (before
+    decompression), so streamed response must be consumed first.
+    urllib3 does not count bytes of chunked body, for it body_size
+    (bytes consumed from stream) or length of read content is used,
+    which is size after decompression.
+
+    Args:
+        response: Response object with read body
+        body_size: Bytes of body consumed from streamed response
+    """
+    raw = getattr(response, "raw", None)
+    body = raw.tell() if hasattr(raw, "tell") else 0
+    if not body:
+        body = len(response.content) if body_size is None else body_size
+    return len(f"HTTP/1.1 {response.status_code} {response.reason}\r\n") + \
+        _headers_size(response.headers) + body
+
+
+def _escape_label(value):
+    """Escape label value for OpenMetrics text format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class NetworkMetrics:
+    """
+    Network cost of every test.
+
+    Accumulates per test node ID:
+    - Number of HTTP calls (and failed calls)
+    - Bytes sent and received
+    - Time spent waiting on network
+
+    Calls are recorded in the process running the test, counters are
+    moved to test report (REPORT_ATTRIBUTE) and merged where reports
+    are collected, so pytest-xdist controller sees all workers.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.tests = {}
+
+    def record(self, nodeid, duration, response=None, body_size=None):
+        """
+        Account one HTTP call.
+
+        Args:
+            nodeid: Node ID of test that made the call
+            duration: Seconds spent on call (with body download)
+            response: Response object with read body, None if call raised error
+            body_size: Bytes of body consumed from streamed response
+        """
+        sent = received = 0
+        if response is not None:
+            sent = request_size(response.request)
+            received = response_size(response, body_size=body_size)
+
+        self.add(nodeid, {
+            "calls": 1,
+            "failed_calls": int(response is None),
+            "bytes_sent": sent,
+            "bytes_received": received,
+            "network_time": duration,
+        })
+
+    def record_stream(self, nodeid, started, response):
+        """
+        Account streamed HTTP call when its response is closed.
+
+        Body is read after the request function returned, so bytes
+        consumed from the stream are counted and the call is recorded
+        on close, with body download in network time.
+
+        Args:
+            nodeid: Node ID of test that made the call
+            started: perf_counter() value before the call
+            response: Response object requested with stream=True
+        """
+        iter_content, close = response.iter_content, response.close
+        consumed = [0]
+
+        def counting_iter_content(*args, **kwargs):
+            for chunk in iter_content(*args, **kwargs):
+                consumed[0] += len(chunk)
+                yield chunk
+
+        def recording_close():
+            response.close = close
+            close()
+            self.record(
+                nodeid,
+                time.perf_counter() - started,
+                response,
+                body_size=consumed[0],
+            )
+
+        response.iter_content = counting_iter_content
+        response.close = recording_close
+
+    def add(self, nodeid, counters):
+        """
+        Add counters to test entry.
+
+        Args:
+            nodeid: Test node ID
+            counters: Dictionary with values for counter fields
+        """
+        with self._lock:
+            entry = self.tests.setdefault(
+                nodeid, {field: 0 for _, _, field in _COUNTERS}
+            )
+            for field in entry:
+                entry[field] += counters.get(field, 0)
+
+    def pop(self, nodeid):
+        """Remove and return counters of test, None if it made no calls."""
+        with self._lock:
+            return self.tests.pop(nodeid, None)
+
+    def totals(self) -> dict:
+        """Sum of all counters over tests."""
+        totals = {field: 0 for _, _, field in _COUNTERS}
+        for entry in self.tests.values():
+            for field in totals:
+                totals[field] += entry[field]
+        return totals
+
+    def write_json(self, path):
+        """Write per-test report sorted by network time to JSON file."""
+        tests = sorted(
+            self.tests.items(),
+            key=lambda item: item[1]["network_time"],
+            reverse=True,
+        )
+        report = {
+            "totals": self.totals(),
+            "tests": [{"nodeid": nodeid, **entry} for nodeid, entry in tests],
+        }
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+    def write_openmetrics(self, path):
+        """Write per-test counters in OpenMetrics text format."""
+        lines = []
+        for name, help_text, field in _COUNTERS:
+            metric = f"{METRIC_PREFIX}_{name}"
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"# HELP {metric} {help_text}")
+            for nodeid in sorted(self.tests):
+                value = self.tests[nodeid][field]
+                lines.append(
+                    f'{metric}_total{{nodeid="{_escape_label(nodeid)}"}} {value}'
+                )
+        lines.append("# EOF")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("\n".join(lines) + "\n")
+
+
+class NetworkReporter:
+    """
+    Pytest plugin collecting network cost from test reports.
+
+    Counters arrive as attribute of teardown reports, which
+    pytest-xdist forwards from workers to controller, so one merged
+    report is written by the process that collects results.
+    """
+    def __init__(self, json_path=None, openmetrics_path=None, write=True):
+        """
+        Initialize reporter.
+
+        Args:
+            json_path: Path of JSON report, None to skip
+            openmetrics_path: Path of OpenMetrics file, None to skip
+            write: Write files at session finish
+                (disabled for pytest-xdist workers, controller writes them)
+        """
+        self.metrics = NetworkMetrics()
+        self.json_path = json_path
+        self.openmetrics_path = openmetrics_path
+        self.write = write
+
+    def pytest_runtest_logreport(self, report):
+        """Merge network cost of finished test."""
+        counters = getattr(report, REPORT_ATTRIBUTE, None)
+        if report.when == "teardown" and counters is not None:
+            self.metrics.add(report.nodeid, counters)
+
+    def pytest_sessionfinish(self, session):
+        """Write merged reports."""
+        if not self.write:
+            return
+        if self.json_path:
+            self.metrics.write_json(self.json_path)
+        if self.openmetrics_path:
+            self.metrics.write_openmetrics(self.openmetrics_path)
@@ -0,0 +1,150 @@
+import json
+import time
+from dataclasses import dataclass
+from statistics import median
+
+import pytest
+
+from utils.metrics import request_size, response_size
+
+
+@dataclass
+class PayloadSample:
+    """
+    Cost of one request with payload of given size.
+
+    Contains payload shape, response status (None if request raised
+    error, e.g. timeout), bytes on the wire in both directions and
+    time spent in client (serialization, sending, reading body),
+    waiting for server and decoding.
+    """
+    method: str
+    fields: int
+    value_length: int
+    status_code: int
+    bytes_sent: int
+    bytes_received: int
+    client_time: float
+    server_latency: float
+    decode_time: float
+
+    @property
+    def total_time(self):
+        """Client and server time spent on request."""
+        return self.client_time + self.server_latency + self.decode_time
+
+
+def measure_payload(method, send, payload_data, fields, value_length):
+    """
+    Send payload and measure cost of each request phase.
+
+    Payload is serialized once, by the request function. Server
+    latency is time until response headers arrived, client time is
+    the rest of the request call.
+
+    Args:
+        method: Request label for report (POST, PUT)
+        send: Function sending payload and returning response
+        payload_data: Dictionary with object data
+        fields: Number of fields in payload data
+        value_length: Length of each field value
+
+    Returns:
+        Tuple of PayloadSample with measured values and response object
+        (None if request raised error)
+    """
+    start = time.perf_counter()
+    try:
+        response = send(payload_data)
+    except (Exception, pytest.fail.Exception):
+        response = None
+    request_time = time.perf_counter() - start
+
+    decode_time = 0.0
+    if response is not None and response.content:
+        start = time.perf_counter()
+        try:
+            json.loads(response.content)
+        except ValueError:
+            pass
+        decode_time = time.perf_counter() - start
+
+    sample = PayloadSample(
+        method=method,
+        fields=fields,
+        value_length=value_length,
+        status_code=None if response is None else response.status_code,
+        bytes_sent=0 if response is None else request_size(response.request),
+        bytes_received=0 if response is None else response_size(response),
+        client_time=(
+            0.0 if response is None
+            else max(request_time - response.elapsed.total_seconds(), 0.0)
+        ),
+        server_latency=(
+            request_time if response is None
+            else response.elapsed.total_seconds()
+        ),
+        decode_time=decode_time,
+    )
+    return sample, response
+
+
+def size_curve(samples) -> list:
+    """
+    Aggregate samples into throughput-versus-size curve.
+
+    Args:
+        samples: List of PayloadSample from repeated measurements
+
+    Returns:
+        List of dictionaries with median values per method and size,
+        sorted by method and bytes sent
+    """
+    groups = {}
+    for sample in samples:
+        key = (sample.method, sample.fields, sample.value_length)
+        groups.setdefault(key, []).append(sample)
+
+    curve = []
+    for (method, fields, value_length), group in groups.items():
+        total_time = median(sample.total_time for sample in group)
+        bytes_sent = median(sample.bytes_sent for sample in group)
+        statuses = sorted({
+            "error" if sample.status_code is None else str(sample.status_code)
+            for sample in group
+        })
+        curve.append({
+            "method": method,
+            "fields": fields,
+            "value_length": value_length,
+            "status": "/".join(statuses),
+            "bytes_sent": bytes_sent,
+            "bytes_received": median(sample.bytes_received for sample in group),
+            "client_time": median(sample.client_time for sample in group),
+            "server_latency": median(sample.server_latency for sample in group),
+            "decode_time": median(sample.decode_time for sample in group),
+            "requests_per_second": 1 / total_time if total_time else 0.0,
+            "bytes_per_second": bytes_sent / total_time if total_time else 0.0,
+        })
+    return sorted(curve, key=lambda row: (row["method"], row["bytes_sent"]))
+
+
+def format_curve(curve) -> str:
+    """Format throughput-versus-size curve as text table."""
+    lines = [
+        f"{'method':<7}{'fields':>7}{'length':>8}{'status':>10}"
+        f"{'sent':>10}{'recv':>10}"
+        f"{'cli ms':>9}{'srv ms':>9}{'dec ms':>9}{'req/s':>9}{'KiB/s':>10}",
+    ]
+    for row in curve:
+        lines.append(
+            f"{row['method']:<7}{row['fields']:>7}{row['value_length']:>8}"
+            f"{row['status']:>10}"
+            f"{row['bytes_sent']:>10.0f}{row['bytes_received']:>10.0f}"
+            f"{row['client_time'] * 1000:>9.3f}"
+            f"{row['server_latency'] * 1000:>9.1f}"
+            f"{row['decode_time'] * 1000:>9.3f}"
+            f"{row['requests_per_second']:>9.2f}"
+            f"{row['bytes_per_second'] / 1024:>10.1f}"
+        )
+    return "\n".join(lines)
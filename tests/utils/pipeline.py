@@ -0,0 +1,254 @@
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, List
+
+from settings import PIPELINE_WORKERS, PIPELINE_QUEUE_SIZE
+
+_STOP = object()
+
+
+def _percentile(values, percent):
+    """Return percentile of values (nearest-rank), 0 for empty list."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, int(round(percent / 100 * len(ordered))) - 1)
+    return ordered[index]
+
+
+@dataclass
+class Stage:
+    """
+    Pipeline stage description.
+
+    Each stage is a pool of worker threads reading from a bounded
+    input queue. Function result is passed to the next stage.
+    """
+    name: str
+    func: Callable
+    workers: int = PIPELINE_WORKERS
+    queue_size: int = PIPELINE_QUEUE_SIZE
+
+
+@dataclass
+class StageStats:
+    """
+    Measurements collected for one pipeline stage.
+
+    Contains processed/failed counters, per-item service and queue
+    wait times, input queue depth samples and worker busy time.
+    """
+    name: str
+    workers: int
+    processed: int = 0
+    failed: int = 0
+    busy_time: float = 0.0
+    started_at: float = None
+    finished_at: float = None
+    service_times: List[float] = field(default_factory=list)
+    wait_times: List[float] = field(default_factory=list)
+    depth_samples: List[int] = field(default_factory=list)
+
+    @property
+    def wall_time(self):
+        """Seconds between first item start and last item finish."""
+        if self.started_at is None:
+            return 0.0
+        return self.finished_at - self.started_at
+
+    @property
+    def throughput(self):
+        """Processed items per second."""
+        if not self.wall_time:
+            return 0.0
+        return self.processed / self.wall_time
+
+    @property
+    def utilization(self):
+        """Share of worker time spent processing items (0..1)."""
+        if not self.wall_time:
+            return 0.0
+        return self.busy_time / (self.wall_time * self.workers)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary with aggregated values."""
+        depth = self.depth_samples or [0]
+        return {
+            "stage": self.name,
+            "workers": self.workers,
+            "processed": self.processed,
+            "failed": self.failed,
+            "throughput": self.throughput,
+            "utilization": self.utilization,
+            "queue_depth_avg": sum(depth) / len(depth),
+            "queue_depth_max": max(depth),
+            "wait_avg": sum(self.wait_times) / max(len(self.wait_times), 1),
+            "latency_p50": _percentile(self.service_times, 50),
+            "latency_p95": _percentile(self.service_times, 95),
+            "latency_max": max(self.service_times, default=0.0),
+        }
+
+
+@dataclass
+class PipelineResult:
+    """
+    Outcome of pipeline run.
+
+    Contains values that passed all stages, failed items with stage
+    name and error, per-stage stats and end-to-end latencies.
+    """
+    results: list
+    errors: list
+    stages: List[StageStats]
+    latencies: List[float]
+    wall_time: float
+
+    @property
+    def throughput(self):
+        """Items completed through all stages per second."""
+        if not self.wall_time:
+            return 0.0
+        return len(self.results) / self.wall_time
+
+    @property
+    def bottleneck(self):
+        """Stage with highest worker utilization."""
+        return max(self.stages, key=lambda stats: stats.utilization).name
+
+    def report(self) -> str:
+        """Format per-stage stats as text table."""
+        lines = [
+            f"{'stage':<12}{'workers':>8}{'done':>8}{'failed':>8}"
+            f"{'items/s':>10}{'util':>7}{'q avg':>7}{'q max':>7}"
+            f"{'wait':>9}{'p50':>9}{'p95':>9}",
+        ]
+        for stats in self.stages:
+            row = stats.to_dict()
+            lines.append(
+                f"{row['stage']:<12}{row['workers']:>8}{row['processed']:>8}"
+                f"{row['failed']:>8}{row['throughput']:>10.2f}"
+                f"{row['utilization']:>7.0%}{row['queue_depth_avg']:>7.1f}"
+                f"{row['queue_depth_max']:>7}{row['wait_avg']:>9.3f}"
+                f"{row['latency_p50']:>9.3f}{row['latency_p95']:>9.3f}"
+            )
+        lines.append(
+            f"end-to-end: {len(self.results)} items in {self.wall_time:.2f}s "
+            f"({self.throughput:.2f} items/s), "
+            f"p95 latency {_percentile(self.latencies, 95):.3f}s, "
+            f"bottleneck: {self.bottleneck}"
+        )
+        return "\n".join(lines)
+
+
+class Pipeline:
+    """
+    Staged pipeline engine with bounded queues.
+
+    Stages are connected by bounded queues, so slow stage blocks its
+    producers (backpressure) instead of accumulating items in memory.
+    Failed items are recorded and dropped from the following stages.
+    """
+    def __init__(self, stages):
+        """
+        Initialize pipeline.
+
+        Args:
+            stages: List of Stage objects in processing order
+        """
+        if not stages:
+            raise ValueError("Pipeline requires at least one stage")
+        self.stages = stages
+
+    def run(self, items) -> PipelineResult:
+        """
+        Pass items through all stages concurrently.
+
+        Args:
+            items: Iterable of input values for the first stage
+
+        Returns:
+            PipelineResult with results, errors and per-stage stats
+        """
+        queues = [queue.Queue(maxsize=stage.queue_size) for stage in self.stages]
+        stats = [StageStats(stage.name, stage.workers) for stage in self.stages]
+        alive = [stage.workers for stage in self.stages]
+        results, errors, latencies = [], [], []
+        lock = threading.Lock()
+
+        def put(index, item):
+            queues[index].put((time.perf_counter(), item))
+            with lock:
+                stats[index].depth_samples.append(queues[index].qsize())
+
+        def worker(index):
+            stage = self.stages[index]
+            last = index == len(self.stages) - 1
+            try:
+                while True:
+                    enqueued_at, item = queues[index].get()
+                    if item is _STOP:
+                        break
+                    created_at, value = item
+                    start = time.perf_counter()
+                    # Any outcome (including pytest skip/fail) only fails the item
+                    try:
+                        value = stage.func(value)
+                        error = None
+                    except BaseException as e:
+                        error = e
+                    end = time.perf_counter()
+
+                    with lock:
+                        stage_stats = stats[index]
+                        if stage_stats.started_at is None or start < stage_stats.started_at:
+                            stage_stats.started_at = start
+                        if stage_stats.finished_at is None or end > stage_stats.finished_at:
+                            stage_stats.finished_at = end
+                        stage_stats.busy_time += end - start
+                        stage_stats.service_times.append(end - start)
+                        stage_stats.wait_times.append(start - enqueued_at)
+                        if error is not None:
+                            stage_stats.failed += 1
+                            errors.append((stage.name, value, error))
+                        else:
+                            stage_stats.processed += 1
+                        if error is None and last:
+                            results.append(value)
+                            latencies.append(end - created_at)
+
+                    if error is None and not last:
+                        put(index + 1, (created_at, value))
+            finally:
+                with lock:
+                    alive[index] -= 1
+                    closing = alive[index] == 0
+                if closing and not last:
+                    for _ in range(self.stages[index + 1].workers):
+                        queues[index + 1].put((None, _STOP))
+
+        threads = [
+            threading.Thread(target=worker, args=(index,), daemon=True)
+            for index, stage in enumerate(self.stages)
+            for _ in range(stage.workers)
+        ]
+        started_at = time.perf_counter()
+        for thread in threads:
+            thread.start()
+
+        for item in items:
+            put(0, (time.perf_counter(), item))
+        for _ in range(self.stages[0].workers):
+            queues[0].put((None, _STOP))
+
+        for thread in threads:
+            thread.join()
+
+        return PipelineResult(
+            results=results,
+            errors=errors,
+            stages=stats,
+            latencies=latencies,
+            wall_time=time.perf_counter() - started_at,
+        )
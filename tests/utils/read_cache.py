@@ -0,0 +1,148 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+from settings import OK, CACHE_TTL, CACHE_MAX_SIZE
+
+NOT_MODIFIED = 304
+
+
+def _cache_key(endpoint, params=None):
+    """Build hashable cache key from endpoint and query parameters."""
+    if not params:
+        return (endpoint, ())
+    items = []
+    for name, value in sorted(params.items()):
+        if isinstance(value, (list, tuple)):
+            value = tuple(value)
+        items.append((name, value))
+    return (endpoint, tuple(items))
+
+
+class ReadCache:
+    """
+    Read layer for idempotent GET requests.
+
+    Reduces round trips to the backend by:
+    - Combining identical in-flight GETs into one request (single-flight)
+    - Serving repeated reads from bounded LRU cache with TTL
+    - Revalidating expired entries with ETag/If-None-Match
+    - Dropping entries on invalidation after PUT/DELETE
+    """
+    def __init__(self, ttl=CACHE_TTL, max_size=CACHE_MAX_SIZE):
+        """
+        Initialize empty cache.
+
+        Args:
+            ttl: Seconds a cached response is served without revalidation
+            max_size: Maximum number of cached responses
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._in_flight = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "revalidated": 0,
+        }
+
+    def get(self, fetch, endpoint, params=None):
+        """
+        Return response for GET request, using cache when possible.
+
+        Args:
+            fetch: GET request function (endpoint, params, headers)
+            endpoint: API endpoint path
+            params: Query parameters
+
+        Returns:
+            Response object (shared between callers of the same key)
+        """
+        key = _cache_key(endpoint, params)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry["stored_at"] < self.ttl:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return entry["response"]
+
+            future = self._in_flight.get(key)
+            if future is not None:
+                self.stats["coalesced"] += 1
+                leader = False
+            else:
+                future = Future()
+                self._in_flight[key] = future
+                self.stats["misses"] += 1
+                generation = self._generation
+                leader = True
+
+        if not leader:
+            return future.result()
+
+        try:
+            response = self._fetch(fetch, key, endpoint, params, entry, generation)
+        except BaseException as e:
+            with self._lock:
+                del self._in_flight[key]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            del self._in_flight[key]
+        future.set_result(response)
+        return response
+
+    def _fetch(self, fetch, key, endpoint, params, entry, generation):
+        """Send request (conditional if ETag is known) and store result."""
+        headers = None
+        if entry is not None and entry["etag"]:
+            headers = {"If-None-Match": entry["etag"]}
+
+        response = fetch(endpoint=endpoint, params=params, headers=headers)
+
+        with self._lock:
+            if response.status_code == NOT_MODIFIED and entry is not None:
+                self.stats["revalidated"] += 1
+                response = entry["response"]
+            elif response.status_code != OK:
+                self._entries.pop(key, None)
+                return response
+
+            # Invalidation happened while request was in flight
+            if generation != self._generation:
+                return response
+
+            self._entries[key] = {
+                "response": response,
+                "etag": response.headers.get("ETag"),
+                "stored_at": time.monotonic(),
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return response
+
+    def invalidate(self, *endpoints):
+        """
+        Drop cached responses for given endpoints.
+
+        Args:
+            endpoints: Endpoint paths whose entries (with any params) are removed
+        """
+        with self._lock:
+            self._generation += 1
+            for key in [k for k in self._entries if k[0] in endpoints]:
+                del self._entries[key]
+
+    def clear(self):
+        """Drop all cached responses."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
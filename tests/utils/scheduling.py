@@ -0,0 +1,161 @@
+import json
+import os
+from statistics import median
+
+from settings import DURATION_SMOOTHING, DEFAULT_TEST_DURATION
+
+
+class DurationHistory:
+    """
+    Per-test duration and failure history kept between sessions.
+
+    Stores for every test node ID:
+    - Smoothed duration (exponential moving average, seconds)
+    - Number of runs and failures
+    """
+    def __init__(self, path):
+        """
+        Load history file if it exists.
+
+        Args:
+            path: Path to JSON history file
+        """
+        self.path = path
+        self.tests = {}
+        self._default_duration = None
+        if os.path.exists(path):
+            try:
+                with open(path, encoding="utf-8") as file:
+                    self.tests = json.load(file)
+            except (OSError, ValueError):
+                self.tests = {}
+
+    def save(self):
+        """Write history to JSON file."""
+        with open(self.path, "w", encoding="utf-8") as file:
+            json.dump(self.tests, file, indent=2, sort_keys=True)
+
+    def record(self, nodeid, duration, failed):
+        """
+        Add result of one test run.
+
+        Args:
+            nodeid: Test node ID
+            duration: Seconds spent on setup, call and teardown
+            failed: True if any phase failed
+        """
+        entry = self.tests.setdefault(
+            nodeid, {"duration": duration, "runs": 0, "failures": 0}
+        )
+        entry["duration"] += DURATION_SMOOTHING * (duration - entry["duration"])
+        entry["runs"] += 1
+        entry["failures"] += int(failed)
+        self._default_duration = None
+
+    def duration(self, nodeid):
+        """Expected duration, median of known tests for new ones."""
+        entry = self.tests.get(nodeid)
+        if entry is not None:
+            return entry["duration"]
+        if self._default_duration is None:
+            self._default_duration = DEFAULT_TEST_DURATION
+            if self.tests:
+                self._default_duration = median(
+                    entry["duration"] for entry in self.tests.values()
+                )
+        return self._default_duration
+
+    def failure_rate(self, nodeid):
+        """Smoothed failure rate, 0.5 for tests without history."""
+        entry = self.tests.get(nodeid, {"runs": 0, "failures": 0})
+        return (entry["failures"] + 1) / (entry["runs"] + 2)
+
+
+class DurationRecorder:
+    """
+    Pytest plugin recording test results into DurationHistory.
+
+    Durations of setup, call and teardown are summed per test,
+    history is saved at session finish.
+    """
+    def __init__(self, history, save=True):
+        """
+        Initialize recorder.
+
+        Args:
+            history: DurationHistory to update
+            save: Write history file at session finish
+                (disabled for pytest-xdist workers, controller saves it)
+        """
+        self.history = history
+        self.save = save
+        self._durations = {}
+        self._failed = {}
+        self._recorded = False
+
+    def pytest_runtest_logreport(self, report):
+        """Accumulate phase duration and outcome, record after teardown."""
+        nodeid = report.nodeid
+        self._durations[nodeid] = self._durations.get(nodeid, 0.0) + report.duration
+        self._failed[nodeid] = self._failed.get(nodeid, False) or report.failed
+        if report.when == "teardown":
+            self.history.record(
+                nodeid,
+                self._durations.pop(nodeid),
+                self._failed.pop(nodeid),
+            )
+            self._recorded = True
+
+    def pytest_sessionfinish(self, session):
+        """Save history if any test was run."""
+        if self.save and self._recorded:
+            self.history.save()
+
+
+def order_longest_first(items, history):
+    """
+    Sort test items by expected duration, longest first.
+
+    Starting long tests first lets parallel workers finish at about
+    the same time (LPT scheduling), which shortens makespan.
+
+    Args:
+        items: Collected pytest items
+        history: DurationHistory
+
+    Returns:
+        New list of items
+    """
+    return sorted(items, key=lambda item: -history.duration(item.nodeid))
+
+
+def select_within_budget(items, history, budget):
+    """
+    Choose most valuable tests that fit into time budget.
+
+    Value of test is its failure rate, tests are taken greedily by
+    value per second of expected duration.
+
+    Args:
+        items: Collected pytest items
+        history: DurationHistory
+        budget: Time budget in seconds
+
+    Returns:
+        Tuple of (selected items in original order, deselected items)
+    """
+    def density(item):
+        duration = max(history.duration(item.nodeid), 1e-3)
+        return history.failure_rate(item.nodeid) / duration
+
+    chosen = set()
+    spent = 0.0
+    for item in sorted(items, key=density, reverse=True):
+        duration = history.duration(item.nodeid)
+        if spent + duration <= budget:
+            chosen.add(item.nodeid)
+            spent += duration
+
+    selected = [item for item in items if item.nodeid in chosen]
+    deselected = [item for item in items if item.nodeid not in chosen]
+    return selected, deselected
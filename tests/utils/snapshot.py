@@ -0,0 +1,188 @@
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Set
+
+from settings import SNAPSHOT_TREE_DEPTH
+
+_HEX_DIGITS = "0123456789abcdef"
+
+
+def _digest(data: bytes) -> str:
+    """Return hex SHA-256 digest of data."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def object_hash(obj: dict) -> str:
+    """Hash object by canonical JSON (sorted keys, no whitespace)."""
+    canonical = json.dumps(obj, sort_keys=True, separators=(",", ":"))
+    return _digest(canonical.encode())
+
+
+@dataclass
+class SnapshotDiff:
+    """
+    Difference between two snapshots of objects collection.
+
+    Contains IDs of objects added, removed and changed in newer snapshot.
+    """
+    added: Set[str] = field(default_factory=set)
+    removed: Set[str] = field(default_factory=set)
+    changed: Set[str] = field(default_factory=set)
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.changed)
+
+
+class Snapshot:
+    """
+    Content hashes of objects collection.
+
+    Stores hash per object ID (once, in buckets) and Merkle-style
+    tree over them:
+    - Objects are placed in buckets by prefix of hashed ID
+    - Each tree node hashes its children, root hashes whole collection
+    - Equal roots mean unchanged collection, diff descends only
+      into subtrees whose hashes differ
+    """
+    def __init__(self, hashes, depth=SNAPSHOT_TREE_DEPTH):
+        """
+        Build tree from object hashes.
+
+        Args:
+            hashes: Dictionary of object ID to object hash
+            depth: Number of hex digits of hashed ID used for buckets
+        """
+        self.depth = depth
+        self._buckets = {}
+        self._nodes = {}
+        for object_id, h in hashes.items():
+            object_id = str(object_id)
+            self._buckets.setdefault(self._bucket(object_id), {})[object_id] = h
+        self._size = sum(len(bucket) for bucket in self._buckets.values())
+        self._build_tree()
+
+    @classmethod
+    def from_objects(cls, objects, depth=SNAPSHOT_TREE_DEPTH):
+        """
+        Create snapshot from decoded objects.
+
+        Args:
+            objects: Iterable of object dictionaries with "id" key
+                (list, SpilledCollection or generator)
+            depth: Number of hex digits of hashed ID used for buckets
+
+        Returns:
+            Snapshot of given objects
+        """
+        hashes = {str(obj["id"]): object_hash(obj) for obj in objects}
+        return cls(hashes, depth=depth)
+
+    @classmethod
+    def load(cls, path):
+        """Load snapshot saved with save()."""
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+        return cls(data["hashes"], depth=data["depth"])
+
+    def save(self, path):
+        """Save object hashes to JSON file."""
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"depth": self.depth, "hashes": self.hashes}, file)
+
+    @property
+    def hashes(self):
+        """Dictionary of object ID to object hash."""
+        return {
+            object_id: h
+            for bucket in self._buckets.values()
+            for object_id, h in bucket.items()
+        }
+
+    def _bucket(self, object_id):
+        """Return bucket prefix for object ID."""
+        return _digest(object_id.encode())[:self.depth]
+
+    def _build_tree(self):
+        """Hash buckets, then every level of tree up to root."""
+        level = {}
+        for prefix, bucket in self._buckets.items():
+            members = "".join(
+                f"{object_id}:{bucket[object_id]};" for object_id in sorted(bucket)
+            )
+            level[prefix] = _digest(members.encode())
+        self._nodes.update(level)
+
+        for _ in range(self.depth):
+            parents = {}
+            for prefix in sorted(level):
+                parents.setdefault(prefix[:-1], []).append(
+                    f"{prefix[-1]}{level[prefix]}"
+                )
+            level = {
+                prefix: _digest("".join(children).encode())
+                for prefix, children in parents.items()
+            }
+            self._nodes.update(level)
+
+    @property
+    def root(self):
+        """Hash of whole collection (None for empty collection)."""
+        return self._nodes.get("")
+
+    def __len__(self):
+        return self._size
+
+    def diff(self, newer) -> SnapshotDiff:
+        """
+        Compare with newer snapshot.
+
+        Only subtrees with different hashes are visited, so cost is
+        proportional to number of changes, not collection size.
+
+        Args:
+            newer: Snapshot taken later with the same depth
+
+        Returns:
+            SnapshotDiff with added, removed and changed IDs
+        """
+        if newer.depth != self.depth:
+            raise ValueError(f"Snapshot depth mismatch: {self.depth} != {newer.depth}")
+
+        result = SnapshotDiff()
+        pending = [""]
+        while pending:
+            prefix = pending.pop()
+            if self._nodes.get(prefix) == newer._nodes.get(prefix):
+                continue
+            if len(prefix) < self.depth:
+                pending.extend(prefix + digit for digit in _HEX_DIGITS)
+                continue
+
+            old = self._buckets.get(prefix, {})
+            new = newer._buckets.get(prefix, {})
+            result.removed.update(old.keys() - new.keys())
+            result.added.update(new.keys() - old.keys())
+            result.changed.update(
+                object_id for object_id in old.keys() & new.keys()
+                if old[object_id] != new[object_id]
+            )
+        return result
+
+
+def fetch_changes(client, diff):
+    """
+    Re-fetch only added and changed objects.
+
+    Args:
+        client: ObjectClient used for request
+        diff: SnapshotDiff between two snapshots
+
+    Returns:
+        Response object with list of added and changed objects,
+        None if nothing to fetch
+    """
+    ids = sorted(diff.added | diff.changed)
+    if not ids:
+        return None
+    return client.get_list_by_ids(id_list=ids)
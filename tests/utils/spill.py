@@ -0,0 +1,146 @@
+import json
+import mmap
+import re
+import tempfile
+from array import array
+
+from settings import OK, SPILL_CHUNK_SIZE
+
+# Strings are matched whole, so brackets inside them are skipped
+_TOKEN = re.compile(rb'"(?:[^"\\]|\\.)*"|[{}\[\]]', re.DOTALL)
+_KEY_VALUE = re.compile(rb'\s*:\s*("(?:[^"\\]|\\.)*"|[^\s,}\]]+)', re.DOTALL)
+
+
+class SpilledCollection:
+    """
+    JSON array of objects spilled to memory-mapped temporary file.
+
+    Response body is streamed to disk and indexed by object ID,
+    so objects are decoded lazily one at a time:
+    - Look up object by ID
+    - Iterate objects in response order
+    - Check membership and size without decoding
+    """
+    def __init__(self, file, status_code=None):
+        """
+        Map file and build offset index.
+
+        Only OK response (or file without status) holding JSON array
+        is indexed, other bodies (e.g. error object) give empty collection.
+
+        Args:
+            file: Binary file object with JSON array of objects
+            status_code: HTTP status code of response the file came from
+        """
+        self.status_code = status_code
+        self._file = file
+        file.seek(0, 2)
+        if file.tell():
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self._map = b""
+        self._starts = array("Q")
+        self._ends = array("Q")
+        self._positions = {}
+        if status_code is None or status_code == OK:
+            self._build_index()
+
+    @classmethod
+    def from_response(cls, response, chunk_size=SPILL_CHUNK_SIZE):
+        """
+        Stream response body to temporary file.
+
+        Args:
+            response: Response object requested with stream=True
+            chunk_size: Bytes read from network per chunk
+
+        Returns:
+            SpilledCollection over response body
+        """
+        file = tempfile.TemporaryFile()
+        try:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                file.write(chunk)
+            file.flush()
+        except BaseException:
+            file.close()
+            raise
+        finally:
+            response.close()
+        return cls(file, status_code=response.status_code)
+
+    def _build_index(self):
+        """Record byte offsets and ID of every object of top-level array."""
+        depth = 0
+        start = None
+        object_id = None
+        for token in _TOKEN.finditer(self._map):
+            char = token.group()[:1]
+            if depth == 0 and char != b"[":
+                # Body is not JSON array (or array already ended)
+                break
+            if char == b'"':
+                if depth == 2 and object_id is None and token.group() == b'"id"':
+                    value = _KEY_VALUE.match(self._map, token.end())
+                    if value:
+                        object_id = str(json.loads(value.group(1)))
+            elif char in b"{[":
+                depth += 1
+                if depth == 2 and char == b"{":
+                    start = token.start()
+                    object_id = None
+            else:
+                depth -= 1
+                if depth == 1 and start is not None:
+                    if object_id is not None:
+                        self._positions[object_id] = len(self._starts)
+                    self._starts.append(start)
+                    self._ends.append(token.end())
+                    start = None
+
+    def _decode(self, position):
+        """Decode object stored at index position."""
+        raw = self._map[self._starts[position]:self._ends[position]]
+        return json.loads(raw)
+
+    def get(self, object_id, default=None):
+        """
+        Decode object by ID.
+
+        Args:
+            object_id: Object identifier (compared as string)
+            default: Value returned if object is missing
+
+        Returns:
+            Dictionary with object data or default
+        """
+        position = self._positions.get(str(object_id))
+        if position is None:
+            return default
+        return self._decode(position)
+
+    def ids(self):
+        """Return list of indexed object IDs in response order."""
+        return list(self._positions)
+
+    def __len__(self):
+        return len(self._starts)
+
+    def __contains__(self, object_id):
+        return str(object_id) in self._positions
+
+    def __iter__(self):
+        for position in range(len(self._starts)):
+            yield self._decode(position)
+
+    def close(self):
+        """Unmap and delete temporary file."""
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,173 @@
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.connection import allowed_gai_family
+
+from settings import HTTP_POOL_SIZE, DNS_CACHE_TTL
+
+
+def create_session(pool_size=HTTP_POOL_SIZE):
+    """
+    Create HTTP session with connection pool shared by all requests.
+
+    Args:
+        pool_size: Maximum number of kept-alive connections per host
+
+    Returns:
+        requests.Session with pooled adapters for http and https
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class DnsCache:
+    """
+    Process-wide cache of DNS lookups for selected hosts.
+
+    Wraps socket.getaddrinfo while installed, lookups of other hosts
+    are passed through unchanged.
+    """
+    def __init__(self, hosts, ttl=DNS_CACHE_TTL):
+        """
+        Initialize cache.
+
+        Args:
+            hosts: Host names whose lookups are cached
+            ttl: Seconds a cached lookup is reused
+        """
+        self.hosts = set(hosts)
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._original = None
+
+    def getaddrinfo(self, host, port, *args, **kwargs):
+        """Cached replacement of socket.getaddrinfo."""
+        lookup = self._original or socket.getaddrinfo
+        if host not in self.hosts:
+            return lookup(host, port, *args, **kwargs)
+
+        key = (host, port, args, tuple(sorted(kwargs.items())))
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.ttl:
+            return entry[1]
+
+        result = lookup(host, port, *args, **kwargs)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), result)
+        return result
+
+    def install(self):
+        """Start serving lookups of cached hosts from cache."""
+        if self._original is None:
+            self._original = socket.getaddrinfo
+            socket.getaddrinfo = self.getaddrinfo
+
+    def uninstall(self):
+        """Restore original socket.getaddrinfo."""
+        if self._original is not None:
+            socket.getaddrinfo = self._original
+            self._original = None
+
+
+@dataclass
+class WarmupReport:
+    """
+    Time spent on session start warm-up.
+
+    Contains DNS lookup time and outcome, time to open pooled
+    connections, number of connections requested and opened.
+    """
+    host: str
+    dns_time: float
+    dns_failed: bool
+    connect_time: float
+    requested: int
+    connections: int
+
+    @property
+    def connection_errors(self):
+        """Number of warm-up connections that failed to open."""
+        return self.requested - self.connections
+
+    @property
+    def total_time(self):
+        """Whole warm-up time in seconds."""
+        return self.dns_time + self.connect_time
+
+    def summary(self) -> str:
+        """Format report as one line."""
+        dns = "failed" if self.dns_failed else "ok"
+        return (
+            f"Warm-up {self.host}: {self.total_time:.3f}s "
+            f"(DNS {dns} {self.dns_time:.3f}s, "
+            f"{self.connections}/{self.requested} connections opened "
+            f"{self.connect_time:.3f}s, {self.connection_errors} failed)"
+        )
+
+
+def warm_up(session, url, connections, dns_cache=None, timeout=None):
+    """
+    Resolve host and open pooled connections before tests start.
+
+    Steps:
+        1. Resolve host (result is kept in DNS cache if given)
+        2. Send HEAD requests from `connections` threads at once,
+           so each opens own connection that stays in session pool
+        3. Measure time of both steps
+
+    Args:
+        session: Session created by create_session()
+        url: Base URL of API
+        connections: Number of connections to open
+        dns_cache: Installed DnsCache for URL host
+        timeout: Timeout of each warm-up request
+
+    Returns:
+        WarmupReport with measured times
+    """
+    parts = urlsplit(url)
+    port = parts.port or (443 if parts.scheme == "https" else 80)
+    resolve = dns_cache.getaddrinfo if dns_cache else socket.getaddrinfo
+
+    dns_failed = False
+    start = time.perf_counter()
+    try:
+        # Same arguments as urllib3 uses, so the lookup is reused
+        resolve(parts.hostname, port, allowed_gai_family(), socket.SOCK_STREAM)
+    except OSError:
+        dns_failed = True
+    dns_time = time.perf_counter() - start
+
+    def open_connection(_):
+        try:
+            session.head(url, timeout=timeout)
+            return 1
+        except requests.RequestException:
+            return 0
+
+    opened = 0
+    start = time.perf_counter()
+    if connections:
+        with ThreadPoolExecutor(max_workers=connections) as pool:
+            opened = sum(pool.map(open_connection, range(connections)))
+    connect_time = time.perf_counter() - start
+
+    return WarmupReport(
+        host=parts.hostname,
+        dns_time=dns_time,
+        dns_failed=dns_failed,
+        connect_time=connect_time,
+        requested=connections,
+        connections=opened,
+    )
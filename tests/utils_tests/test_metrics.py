@@ -0,0 +1,218 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from utils import (
+    NetworkMetrics,
+    NetworkReporter,
+    REPORT_ATTRIBUTE,
+)
+from utils.metrics import (
+    request_size,
+    response_size,
+)
+
+
+class FakeRaw:
+    """urllib3 response stub reporting bytes read from the socket."""
+    def __init__(self, wire_bytes):
+        self.wire_bytes = wire_bytes
+
+    def tell(self):
+        return self.wire_bytes
+
+
+class FakeResponse:
+    """Response stub with request, headers, body and raw stream."""
+    def __init__(self, content=b"", wire_bytes=0, chunks=()):
+        self.request = SimpleNamespace(
+            method="POST",
+            path_url="/objects",
+            headers={"Host": "api"},
+            body='{"name": "x"}',
+        )
+        self.status_code = 200
+        self.reason = "OK"
+        self.headers = {"Content-Encoding": "gzip"}
+        self.content = content
+        self.raw = FakeRaw(wire_bytes)
+        self.chunks = list(chunks)
+        self.closed = False
+
+    def iter_content(self, chunk_size=1):
+        yield from self.chunks
+
+    def close(self):
+        self.closed = True
+
+
+def counters(calls=1, failed=0, sent=0, received=0, seconds=0.0):
+    """Build counters of one test."""
+    return {
+        "calls": calls,
+        "failed_calls": failed,
+        "bytes_sent": sent,
+        "bytes_received": received,
+        "network_time": seconds,
+    }
+
+
+def teardown_report(nodeid, cost=None, when="teardown"):
+    """Build test report carrying network cost like makereport hook does."""
+    report = pytest.TestReport(nodeid, ("test.py", 1, nodeid), {}, "passed", None, when)
+    if cost is not None:
+        setattr(report, REPORT_ATTRIBUTE, cost)
+    return report
+
+
+class TestNetworkMetrics:
+    """
+    Test suite for per-test network counters and their export.
+
+    Tests that metrics:
+    - Sum counters per test and over tests
+    - Size requests and responses by bytes on the wire
+    - Record streamed response when it is closed
+    - Write JSON and OpenMetrics reports
+    """
+
+    def test_add_pop_totals(self):
+        """TEST: Counters are summed per test, popped and totalled."""
+        metrics = NetworkMetrics()
+        metrics.add("a", counters(sent=10, seconds=0.5))
+        metrics.add("a", counters(failed=1, seconds=0.25))
+        metrics.add("b", counters(received=7))
+
+        assert metrics.totals() == counters(calls=3, failed=1, sent=10, received=7, seconds=0.75)
+        assert metrics.pop("a") == counters(calls=2, failed=1, sent=10, seconds=0.75)
+        assert metrics.pop("a") is None
+        assert list(metrics.tests) == ["b"]
+
+    def test_wire_sizes(self):
+        """TEST: Response body is sized by socket bytes, not decoded content.
+
+        Verifies:
+        - Request size counts request line, headers and body
+        - Compressed body uses raw byte count
+        - Chunked body (no raw count) falls back to consumed or read bytes
+        """
+        compressed = FakeResponse(content=b"x" * 1000, wire_bytes=100)
+        chunked = FakeResponse(content=b"x" * 1000)
+        head = response_size(FakeResponse())
+
+        assert request_size(compressed.request) == (
+            len("POST /objects HTTP/1.1\r\n") + len("Host: api\r\n") + 2 + 13
+        )
+        assert response_size(compressed) == head + 100
+        assert response_size(chunked) == head + 1000
+        assert response_size(chunked, body_size=300) == head + 300
+
+    def test_record_stream_on_close(self):
+        """TEST: Streamed call is recorded on close with consumed bytes."""
+        metrics = NetworkMetrics()
+        response = FakeResponse(chunks=[b"abc", b"de"])
+        head = response_size(FakeResponse())
+
+        metrics.record_stream("a", 0.0, response)
+        assert metrics.tests == {}
+
+        consumed = b"".join(response.iter_content(chunk_size=2))
+        response.close()
+        response.close()
+
+        assert consumed == b"abcde"
+        assert response.closed
+        assert metrics.tests["a"]["calls"] == 1
+        assert metrics.tests["a"]["bytes_received"] == head + 5
+        assert metrics.tests["a"]["network_time"] > 0
+
+    def test_write_json(self, tmp_path):
+        """TEST: JSON report has totals and tests sorted by network time."""
+        metrics = NetworkMetrics()
+        metrics.add("fast", counters(seconds=0.1))
+        metrics.add("slow", counters(seconds=2.0))
+        path = tmp_path / "network.json"
+
+        metrics.write_json(path)
+        report = json.loads(path.read_text(encoding="utf-8"))
+
+        assert [test["nodeid"] for test in report["tests"]] == ["slow", "fast"]
+        assert report["totals"]["calls"] == 2
+
+    def test_write_openmetrics(self, tmp_path):
+        """TEST: OpenMetrics file has counter families, escaped labels and EOF."""
+        metrics = NetworkMetrics()
+        metrics.add('test.py::test["a\\b"]\n', counters(sent=5))
+        path = tmp_path / "network.prom"
+
+        metrics.write_openmetrics(path)
+        lines = path.read_text(encoding="utf-8").splitlines()
+
+        assert "# TYPE api_test_bytes_sent counter" in lines
+        assert 'api_test_bytes_sent_total{nodeid="test.py::test[\\"a\\\\b\\"]\\n"} 5' in lines
+        assert all(
+            line.startswith("#") or "_total{" in line for line in lines
+        )
+        assert lines[-1] == "# EOF"
+
+
+class TestNetworkReporter:
+    """
+    Test suite for merging network cost from test reports.
+
+    Tests that reporter:
+    - Merges teardown reports of several workers
+    - Ignores other phases and reports without counters
+    - Writes files only when allowed
+    """
+
+    def test_merge_worker_reports(self, pytestconfig, tmp_path):
+        """TEST: Reports serialized like pytest-xdist does are merged.
+
+        Steps:
+        1. Build teardown reports of two workers with counters
+        2. Pass them through report serialization hooks
+        3. Feed them to reporter and write JSON report
+        4. Verify counters of both workers are in one report
+        """
+        path = tmp_path / "network.json"
+        reporter = NetworkReporter(json_path=path)
+        reports = [
+            teardown_report("a", counters(sent=10)),
+            teardown_report("b", counters(sent=20, seconds=1.0)),
+            teardown_report("a", counters(received=3)),
+            teardown_report("c", counters(), when="call"),
+            teardown_report("d"),
+        ]
+        for report in reports:
+            data = pytestconfig.hook.pytest_report_to_serializable(
+                config=pytestconfig, report=report
+            )
+            received = pytestconfig.hook.pytest_report_from_serializable(
+                config=pytestconfig, data=json.loads(json.dumps(data))
+            )
+            assert received.user_properties == []
+            reporter.pytest_runtest_logreport(received)
+        reporter.pytest_sessionfinish(session=None)
+
+        report = json.loads(path.read_text(encoding="utf-8"))
+        assert [test["nodeid"] for test in report["tests"]] == ["b", "a"]
+        assert report["totals"] == counters(calls=3, sent=30, received=3, seconds=1.0)
+
+    @pytest.mark.parametrize("write", (True, False))
+    def test_write_only_when_allowed(self, tmp_path, write):
+        """TEST: Reporter of pytest-xdist worker writes no files.
+
+        Args:
+            write: Reporter is allowed to write files
+        """
+        json_path = tmp_path / "network.json"
+        openmetrics_path = tmp_path / "network.prom"
+        reporter = NetworkReporter(json_path, openmetrics_path, write=write)
+        reporter.pytest_runtest_logreport(teardown_report("a", counters()))
+
+        reporter.pytest_sessionfinish(session=None)
+
+        assert json_path.exists() is write
+        assert openmetrics_path.exists() is write
@@ -0,0 +1,180 @@
+from dataclasses import dataclass
+
+import pytest
+
+from settings import (
+    DURATION_SMOOTHING,
+    DEFAULT_TEST_DURATION,
+)
+from utils import (
+    DurationHistory,
+    DurationRecorder,
+    order_longest_first,
+    select_within_budget,
+)
+
+
+@dataclass
+class FakeItem:
+    """Collected test item stub."""
+    nodeid: str
+
+
+@dataclass
+class FakeReport:
+    """Test phase report stub."""
+    nodeid: str
+    when: str
+    duration: float
+    failed: bool = False
+
+
+def history_with(tmp_path, durations, failures=None):
+    """Build history with given durations and failed runs per test."""
+    history = DurationHistory(tmp_path / "durations.json")
+    for nodeid, duration in durations.items():
+        history.record(nodeid, duration, failed=False)
+    for nodeid, count in (failures or {}).items():
+        for _ in range(count):
+            history.tests[nodeid]["runs"] += 1
+            history.tests[nodeid]["failures"] += 1
+    return history
+
+
+class TestDurationHistory:
+    """
+    Test suite for test duration history.
+
+    Tests that history:
+    - Smooths durations with exponential moving average
+    - Gives median duration to unknown tests
+    - Survives missing and corrupt files
+    """
+
+    def test_smoothed_duration(self, tmp_path):
+        """TEST: Repeated runs move duration towards new value."""
+        history = DurationHistory(tmp_path / "durations.json")
+        history.record("a", 1.0, failed=False)
+        history.record("a", 2.0, failed=True)
+
+        assert history.duration("a") == pytest.approx(1.0 + DURATION_SMOOTHING)
+        assert history.tests["a"]["runs"] == 2
+        assert history.tests["a"]["failures"] == 1
+        assert history.failure_rate("a") == pytest.approx(2 / 4)
+
+    def test_default_duration(self, tmp_path):
+        """TEST: Unknown test gets median duration, default without history.
+
+        Verifies:
+        - Empty history gives DEFAULT_TEST_DURATION
+        - Median is recomputed after new record
+        """
+        history = DurationHistory(tmp_path / "durations.json")
+        assert history.duration("new") == DEFAULT_TEST_DURATION
+        assert history.failure_rate("new") == 0.5
+
+        history.record("a", 1.0, failed=False)
+        history.record("b", 3.0, failed=False)
+        history.record("c", 10.0, failed=False)
+        assert history.duration("new") == 3.0
+
+        history.record("d", 20.0, failed=False)
+        assert history.duration("new") == 6.5
+
+    def test_save_and_load(self, tmp_path):
+        """TEST: Saved history is loaded in next session."""
+        path = tmp_path / "durations.json"
+        history = DurationHistory(path)
+        history.record("a", 1.5, failed=True)
+        history.save()
+
+        assert DurationHistory(path).tests == history.tests
+
+    def test_corrupt_file(self, tmp_path):
+        """TEST: Corrupt history file is ignored."""
+        path = tmp_path / "durations.json"
+        path.write_text("{not json", encoding="utf-8")
+
+        history = DurationHistory(path)
+
+        assert history.tests == {}
+        assert history.duration("a") == DEFAULT_TEST_DURATION
+
+
+class TestScheduling:
+    """
+    Test suite for test ordering and time budget selection.
+
+    Tests that:
+    - Tests are ordered longest first
+    - Budget keeps tests with most failures per second
+    - Recorder sums phases and saves only when allowed
+    """
+
+    def test_longest_first(self, tmp_path):
+        """TEST: Items are sorted by expected duration, unknown get median."""
+        history = history_with(tmp_path, {"a": 1.0, "b": 5.0, "c": 3.0})
+        items = [FakeItem(nodeid) for nodeid in ("a", "new", "b", "c")]
+
+        ordered = order_longest_first(items, history)
+
+        assert [item.nodeid for item in ordered] == ["b", "new", "c", "a"]
+
+    @pytest.mark.parametrize(
+        ("budget", "expected"),
+        (
+            (0.0, []),  # Nothing fits
+            (0.5, []),  # Shorter than every test
+            (2.0, ["flaky"]),  # Exactly one test
+            (3.0, ["flaky", "stable"]),  # Two tests at budget edge
+            (100.0, ["flaky", "stable", "slow"]),  # Everything fits
+        )
+    )
+    def test_select_within_budget(self, tmp_path, budget, expected):
+        """TEST: Budget selection prefers failures per second.
+
+        Args:
+            budget: Time budget in seconds
+            expected: Node IDs of selected tests
+        """
+        history = history_with(
+            tmp_path,
+            {"slow": 10.0, "stable": 1.0, "flaky": 2.0},
+            failures={"flaky": 5},
+        )
+        items = [FakeItem(nodeid) for nodeid in ("slow", "stable", "flaky")]
+
+        selected, deselected = select_within_budget(items, history, budget)
+
+        assert sorted(item.nodeid for item in selected) == sorted(expected)
+        assert sorted(item.nodeid for item in deselected) == sorted(
+            {"slow", "stable", "flaky"} - set(expected)
+        )
+        assert [item.nodeid for item in selected] == [
+            item.nodeid for item in items if item.nodeid in expected
+        ]
+
+    def test_recorder(self, tmp_path):
+        """TEST: Recorder sums setup, call and teardown and saves history."""
+        path = tmp_path / "durations.json"
+        history = DurationHistory(path)
+        recorder = DurationRecorder(history)
+        for when, duration, failed in (
+            ("setup", 0.1, False), ("call", 1.0, True), ("teardown", 0.2, False),
+        ):
+            recorder.pytest_runtest_logreport(FakeReport("a", when, duration, failed))
+        recorder.pytest_sessionfinish(session=None)
+
+        assert history.tests["a"]["duration"] == pytest.approx(1.3)
+        assert history.tests["a"]["failures"] == 1
+        assert DurationHistory(path).tests == history.tests
+
+    def test_recorder_without_save(self, tmp_path):
+        """TEST: Recorder of xdist worker or run without tests writes nothing."""
+        path = tmp_path / "durations.json"
+        worker = DurationRecorder(DurationHistory(path), save=False)
+        worker.pytest_runtest_logreport(FakeReport("a", "teardown", 0.1))
+        worker.pytest_sessionfinish(session=None)
+        DurationRecorder(DurationHistory(path)).pytest_sessionfinish(session=None)
+
+        assert not path.exists()
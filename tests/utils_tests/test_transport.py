@@ -0,0 +1,145 @@
+import socket
+import threading
+
+import pytest
+import requests
+
+from utils import (
+    DnsCache,
+    WarmupReport,
+    warm_up,
+)
+
+
+class StubGetaddrinfo:
+    """socket.getaddrinfo stub counting lookups per host."""
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.lookups = []
+
+    def __call__(self, host, port, *args, **kwargs):
+        self.lookups.append(host)
+        if host in self.failing:
+            raise socket.gaierror(f"Cannot resolve {host}")
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.1", port))]
+
+
+class FakeSession:
+    """HTTP session stub whose first HEAD requests fail."""
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.heads = []
+        self._lock = threading.Lock()
+
+    def head(self, url, timeout=None):
+        with self._lock:
+            self.heads.append(url)
+            failed = len(self.heads) <= self.failures
+        if failed:
+            raise requests.ConnectionError("Connection refused")
+
+
+@pytest.fixture
+def lookup(monkeypatch):
+    """Replace socket.getaddrinfo with counting stub."""
+    stub = StubGetaddrinfo(failing={"unknown.example"})
+    monkeypatch.setattr(socket, "getaddrinfo", stub)
+    return stub
+
+
+class TestDnsCache:
+    """
+    Test suite for DNS cache with stub getaddrinfo.
+
+    Tests that cache:
+    - Serves repeated lookups of cached hosts within TTL
+    - Passes lookups of other hosts through
+    - Restores socket.getaddrinfo on uninstall
+    """
+
+    def test_cached_host(self, lookup):
+        """TEST: Lookup of cached host is resolved once within TTL."""
+        cache = DnsCache(["api.example"])
+        cache.install()
+        try:
+            first = socket.getaddrinfo("api.example", 443)
+            second = socket.getaddrinfo("api.example", 443)
+            socket.getaddrinfo("other.example", 443)
+            socket.getaddrinfo("other.example", 443)
+        finally:
+            cache.uninstall()
+
+        assert second == first
+        assert lookup.lookups == ["api.example", "other.example", "other.example"]
+        assert socket.getaddrinfo is lookup
+
+    def test_expired_entry(self, lookup):
+        """TEST: Lookup after TTL expiry is resolved again."""
+        cache = DnsCache(["api.example"], ttl=0)
+
+        cache.getaddrinfo("api.example", 443)
+        cache.getaddrinfo("api.example", 443)
+
+        assert lookup.lookups == ["api.example", "api.example"]
+
+    def test_failed_lookup_not_cached(self, lookup):
+        """TEST: Failed lookup raises and is retried next time."""
+        cache = DnsCache(["unknown.example"])
+
+        for _ in range(2):
+            with pytest.raises(OSError):
+                cache.getaddrinfo("unknown.example", 443)
+
+        assert lookup.lookups == ["unknown.example", "unknown.example"]
+
+
+class TestWarmUp:
+    """
+    Test suite for session warm-up with fake session.
+
+    Tests that report:
+    - Counts opened and failed connections
+    - Reports DNS failure separately
+    """
+
+    def test_opened_connections(self, lookup):
+        """TEST: Report counts connections that opened and failed."""
+        session = FakeSession(failures=1)
+        cache = DnsCache(["api.example"])
+
+        report = warm_up(session, "https://api.example", 4, dns_cache=cache)
+
+        assert len(session.heads) == 4
+        assert (report.requested, report.connections) == (4, 3)
+        assert report.connection_errors == 1
+        assert not report.dns_failed
+        assert lookup.lookups == ["api.example"]
+        assert "DNS ok" in report.summary()
+        assert "3/4 connections opened" in report.summary()
+
+    def test_dns_failure(self, lookup):
+        """TEST: DNS failure is reported, connections still attempted."""
+        session = FakeSession(failures=2)
+
+        report = warm_up(session, "http://unknown.example:8080", 2)
+
+        assert report.dns_failed
+        assert report.host == "unknown.example"
+        assert report.connections == 0
+        assert "DNS failed" in report.summary()
+
+    def test_no_connections(self, lookup):
+        """TEST: Warm-up with zero connections only resolves host."""
+        session = FakeSession()
+
+        report = warm_up(session, "https://api.example", 0)
+
+        assert session.heads == []
+        assert report == WarmupReport(
+            host="api.example",
+            dns_time=report.dns_time,
+            dns_failed=False,
+            connect_time=report.connect_time,
+            requested=0,
+            connections=0,
+        )